@@ -19,6 +19,7 @@ import asyncio
 import json
 import sys
 import argparse
+from dataclasses import replace
 
 # Add parent to path for local development
 sys.path.insert(0, "/srv/plugins/xwander-bokun")
@@ -91,7 +92,7 @@ async def main(dry_run: bool = False, custom_description: str = None):
 
     config = ROVANIEMI_CONFIG
     if custom_description:
-        config.new_description = custom_description
+        config = replace(config, new_description=custom_description)
 
     print(f"\nSource product ID: {SOURCE_PRODUCT_ID}")
     print(f"New title: {config.title}")
@@ -0,0 +1,29 @@
+"""Pytest configuration for xwander-bokun tests"""
+import os
+import sys
+
+import httpx
+import pytest
+
+# Add plugin directory to path for imports
+plugin_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if plugin_path not in sys.path:
+    sys.path.insert(0, plugin_path)
+
+from xwander_bokun import BokunClient
+
+
+@pytest.fixture
+async def make_client():
+    """Build BokunClients whose requests go to an httpx.MockTransport handler."""
+    clients = []
+
+    def make(handler):
+        client = BokunClient(api_key="test-key", api_secret="test-secret")
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        await client.__aexit__(None, None, None)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Unit tests for booking management
+
+Run with: python3 -m pytest tests/test_booking.py -v
+"""
+
+import json
+
+import httpx
+import pytest
+
+from xwander_bokun import BookingManager
+
+
+def _search_handler(total_hits, n_items, requests):
+    """Answer booking searches with pages cut from n_items bookings."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append(body)
+        start = body["page"] * body["pageSize"]
+        items = [
+            {"id": i, "confirmationCode": f"XWA-{i}"}
+            for i in range(start, min(start + body["pageSize"], n_items))
+        ]
+        return httpx.Response(200, json={"items": items, "totalHits": total_hits})
+    return handler
+
+
+class TestBookingToday:
+    """Test fetching all of today's bookings."""
+
+    async def test_today_fetches_every_page(self, make_client):
+        """Test remaining pages are fetched after the first reports totalHits."""
+        requests = []
+        client = make_client(_search_handler(23, 23, requests))
+
+        bookings = await BookingManager(client).today(page_size=10)
+
+        assert [b.id for b in bookings] == list(range(23))
+        assert sorted(r["page"] for r in requests) == [0, 1, 2]
+        assert all(r["pageSize"] == 10 for r in requests)
+
+    async def test_today_null_total_hits(self, make_client):
+        """Test a null totalHits is treated as a single page."""
+        requests = []
+        client = make_client(_search_handler(None, 4, requests))
+
+        bookings = await BookingManager(client).today(page_size=10)
+
+        assert len(bookings) == 4
+        assert len(requests) == 1
+
+    async def test_today_no_bookings(self, make_client):
+        """Test an empty day makes one request."""
+        requests = []
+        client = make_client(_search_handler(0, 0, requests))
+
+        assert await BookingManager(client).today() == []
+        assert len(requests) == 1
+
+    async def test_today_rejects_bad_page_size(self, make_client):
+        """Test page_size below 1 is rejected before any request."""
+        requests = []
+        client = make_client(_search_handler(0, 0, requests))
+
+        with pytest.raises(ValueError):
+            await BookingManager(client).today(page_size=0)
+        assert requests == []
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Bokun API client
+
+Run with: python3 -m pytest tests/test_client.py -v
+"""
+
+import base64
+import hmac
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+import xwander_bokun.client
+
+
+class _Clock:
+    """Stand-in for datetime whose utcnow() advances a second per call."""
+
+    now = datetime(2026, 1, 5, 12, 0, 0)
+
+    @classmethod
+    def utcnow(cls):
+        cls.now += timedelta(seconds=1)
+        return cls.now
+
+
+def _signature(request: httpx.Request) -> str:
+    """Signature the request should carry for the conftest credentials."""
+    message = (
+        request.headers["X-Bokun-Date"] + "test-key" + request.method
+        + request.url.raw_path.decode("ascii")
+    )
+    digest = hmac.digest(b"test-secret", message.encode("utf-8"), "sha1")
+    return base64.b64encode(digest).decode("utf-8")
+
+
+def _rate_limited_handler(n_limited, requests):
+    """Answer 429 to the first n_limited requests, then 200."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if len(requests) <= n_limited:
+            return httpx.Response(429)
+        return httpx.Response(200, json={"id": 123})
+    return handler
+
+
+class TestRateLimitRetry:
+    """Test the 429 retry loop."""
+
+    @pytest.fixture(autouse=True)
+    def _clock(self, monkeypatch):
+        monkeypatch.setattr(xwander_bokun.client, "datetime", _Clock)
+
+    async def test_retries_and_re_signs(self, make_client):
+        """Test each retry after a 429 is sent with a fresh date and signature."""
+        requests = []
+        client = make_client(_rate_limited_handler(2, requests))
+        client.rate_limiter.backoff_seconds = 0
+
+        assert await client.get("/activity.json/123") == {"id": 123}
+        assert len(requests) == 3
+        assert len({r.headers["X-Bokun-Date"] for r in requests}) == 3
+        assert len({r.headers["X-Bokun-Signature"] for r in requests}) == 3
+        for request in requests:
+            assert request.headers["X-Bokun-Signature"] == _signature(request)
+
+    async def test_gives_up_after_max_retries(self, make_client):
+        """Test the last 429 is raised once max_retries is used up."""
+        requests = []
+        client = make_client(_rate_limited_handler(10, requests))
+        client.rate_limiter.backoff_seconds = 0
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get("/activity.json/123")
+        assert len(requests) == client.max_retries + 1
+
+    async def test_no_retry(self, make_client):
+        """Test retry=False sends a single request."""
+        requests = []
+        client = make_client(_rate_limited_handler(1, requests))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.request("GET", "/activity.json/123", retry=False)
+        assert len(requests) == 1
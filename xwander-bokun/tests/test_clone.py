@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Unit tests for experience cloning
+
+Run with: python3 -m pytest tests/test_clone.py -v
+"""
+
+import copy
+import json
+
+from xwander_bokun import CloneConfig
+from xwander_bokun.clone import _map_v1_to_v2_payload
+
+
+SOURCE = {
+    "id": 1107193,
+    "title": "Aurora Camp",
+    "activityType": "DAY_TOUR_OR_ACTIVITY",
+    "bookingType": "DATE_AND_TIME",
+    "capacityType": "ON_REQUEST",
+    "timeZone": "Europe/Helsinki",
+    "description": "<p>Northern lights by the fire.</p>",
+    "excerpt": "Northern lights",
+    "durationHours": 3,
+    "durationMinutes": 30,
+    "difficultyLevel": "EASY",
+    "minAge": 6,
+    "flags": ["AURORA", "WINTER"],
+    "keywords": ["aurora", "camp"],
+    "bookingCutoffHours": 2,
+    "requestDeadlineDays": 1,
+    "startTimes": [{"hour": 20, "minute": 30, "durationHours": 3, "label": "Evening"}],
+    "pricingCategories": [{"id": 11}, {"id": 12, "defaultCategory": True}, {"title": "No ID"}],
+    "rates": [
+        {"title": "Standard", "cancellationPolicy": {"id": 7}},
+        {"title": "Private", "pricedPerPerson": False},
+    ],
+    "cancellationPolicy": {"id": 5},
+    "activityPriceCatalogs": [
+        {"catalogId": 900, "currencies": [{"currency": "EUR", "default": True}, {"currency": "USD"}]},
+    ],
+    "mainContactFields": [{"field": "FIRST_NAME"}, {"field": "PHONE_NUMBER", "required": False}],
+    "googlePlace": {
+        "countryCode": "FI",
+        "city": "Ivalo",
+        "name": "Ivalo, Finland",
+        "geoLocationCenter": {"lat": 68.66, "lng": 27.54},
+    },
+    "startPoints": [{
+        "title": "Hotel",
+        "address": {
+            "addressLine1": "Main 1",
+            "city": "Ivalo",
+            "postalCode": "99800",
+            "geoPoint": {"latitude": 68.66, "longitude": 27.54},
+        },
+    }],
+    "ticketPerPerson": True,
+    "privateActivity": False,
+    "meetingType": "MEET_ON_LOCATION",
+}
+
+# Mapper output for SOURCE and a title-only config, taken from the original
+# (pre-optimization) implementation
+EXPECTED = {
+    "title": "Aurora Camp Ivalo",
+    "type": "DAY_TOUR_OR_ACTIVITY",
+    "bookingType": "DATE_AND_TIME",
+    "capacityType": "ON_REQUEST",
+    "timeZone": "Europe/Helsinki",
+    "description": "<p>Northern lights by the fire.</p>",
+    "shortDescription": "Northern lights",
+    "duration": {"hours": 3, "minutes": 30, "days": 0, "weeks": 0},
+    "difficultyLevel": "EASY",
+    "minAge": 6,
+    "flags": ["AURORA", "WINTER"],
+    "keywords": ["aurora", "camp"],
+    "cutoff": {"type": "RELATIVE_TO_START_TIME", "minutes": 0, "hours": 2, "days": 0, "weeks": 8},
+    "onRequestDeadline": {"minutes": 0, "hours": 0, "days": 1, "weeks": 0},
+    "startTimes": [{
+        "hour": 20,
+        "minute": 30,
+        "durationHours": 3,
+        "durationMinutes": 0,
+        "durationDays": 0,
+        "durationWeeks": 0,
+        "label": "Evening",
+    }],
+    "pricingCategories": {"ids": [11, 12], "defaultId": 12},
+    "rates": {
+        "rates": [
+            {
+                "title": "Standard",
+                "minPerBooking": 1,
+                "pricedPerPerson": True,
+                "allPricingCategories": True,
+                "allStartTimes": True,
+                "pickupSelectionType": "UNAVAILABLE",
+                "dropoffSelectionType": "UNAVAILABLE",
+                "tieredPricingEnabled": False,
+                "externalId": "rate-default-aurora-camp-ivalo",
+                "cancellationPolicyId": 7,
+            },
+            {
+                "title": "Private",
+                "minPerBooking": 1,
+                "pricedPerPerson": False,
+                "allPricingCategories": True,
+                "allStartTimes": True,
+                "pickupSelectionType": "UNAVAILABLE",
+                "dropoffSelectionType": "UNAVAILABLE",
+                "tieredPricingEnabled": False,
+                "cancellationPolicyId": 5,
+            },
+        ],
+        "defaultRate": {"externalId": "rate-default-aurora-camp-ivalo"},
+    },
+    "pricing": {
+        "experiencePriceRules": [],
+        "extraPriceRules": [],
+        "pickupPriceRules": [],
+        "dropoffPriceRules": [],
+        "priceCatalogCurrencies": [
+            {"priceCatalogId": 900, "currencies": ["EUR", "USD"], "defaultCurrency": "EUR"},
+        ],
+    },
+    "combo": {"isCombo": False},
+    "mainPaxInfo": [
+        {"type": "FIRST_NAME", "required": True, "requiredBeforeDeparture": False},
+        {"type": "PHONE_NUMBER", "required": False, "requiredBeforeDeparture": False},
+    ],
+    "otherPaxInfo": [],
+    "location": {
+        "countryCode": "FI",
+        "city": "Ivalo",
+        "name": "Ivalo, Finland",
+        "latitude": 68.66,
+        "longitude": 27.54,
+    },
+    "availabilityRules": [],
+    "boxSettings": {"isBox": False},
+    "ticket": {"ticketPerPerson": True, "barcodeFormat": "QR_CODE"},
+    "privateExperience": False,
+    "allowCustomizedBookings": False,
+    "meetingType": {
+        "type": "MEET_ON_LOCATION",
+        "meetingPointAddresses": [{
+            "title": "Hotel",
+            "address": {
+                "addressLine1": "Main 1",
+                "city": "Ivalo",
+                "postalCode": "99800",
+                "countryCode": "FI",
+                "latitude": 68.66,
+                "longitude": 27.54,
+            },
+        }],
+        "dropoffService": False,
+    },
+    "activation": {"activated": False},
+    "marketplaceVisibilityType": "PRIVATE",
+}
+
+
+def _as_sent(payload):
+    """The payload as the API receives it (shared empty tuples become [])."""
+    return json.loads(json.dumps(payload))
+
+
+def _containers(value):
+    """Every dict and list nested in value, including value itself."""
+    if isinstance(value, dict):
+        yield value
+        for item in value.values():
+            yield from _containers(item)
+    elif isinstance(value, list):
+        yield value
+        for item in value:
+            yield from _containers(item)
+
+
+class TestMapV1ToV2Payload:
+    """Test mapping a v1 experience to a v2.0 create payload."""
+
+    def test_matches_baseline(self):
+        """Test a title-only clone keeps the source's settings."""
+        payload = _map_v1_to_v2_payload(SOURCE, CloneConfig(title="Aurora Camp Ivalo"))
+        assert _as_sent(payload) == EXPECTED
+
+    def test_matches_baseline_with_overrides(self):
+        """Test config overrides replace the matching parts of the payload."""
+        config = CloneConfig(
+            title="Aurora Camp Rovaniemi",
+            new_city="Rovaniemi",
+            new_latitude=66.5,
+            new_longitude=25.7,
+            new_start_hour=21,
+            new_duration_hours=4,
+            new_description="New",
+            add_flags=["WINTER", "NEW"],
+            add_keywords=["rovaniemi"],
+            keep_unpublished=False,
+        )
+        expected = copy.deepcopy(EXPECTED)
+        expected.update({
+            "title": "Aurora Camp Rovaniemi",
+            "description": "New",
+            "duration": {"hours": 4, "minutes": 0, "days": 0, "weeks": 0},
+            "flags": ["AURORA", "WINTER", "NEW"],
+            "keywords": ["aurora", "camp", "rovaniemi"],
+            "location": {
+                "countryCode": "FI",
+                "city": "Rovaniemi",
+                "name": "Rovaniemi, Finland",
+                "latitude": 66.5,
+                "longitude": 25.7,
+            },
+            "activation": {"activated": True},
+        })
+        expected["startTimes"][0].update({"hour": 21, "durationHours": 4})
+        expected["rates"]["rates"][0]["externalId"] = "rate-default-aurora-camp-rovaniemi"
+        expected["rates"]["defaultRate"] = {"externalId": "rate-default-aurora-camp-rovaniemi"}
+        expected["meetingType"]["meetingPointAddresses"] = [{
+            "title": "Meeting Point - Rovaniemi",
+            "address": {
+                "addressLine1": "",
+                "city": "Rovaniemi",
+                "postalCode": "",
+                "countryCode": "FI",
+                "latitude": 66.5,
+                "longitude": 25.7,
+            },
+        }]
+
+        payload = _map_v1_to_v2_payload(SOURCE, config)
+        assert _as_sent(payload) == expected
+
+    def test_minimal_source_gets_defaults(self):
+        """Test required blocks are filled in for a source with no settings."""
+        payload = _as_sent(_map_v1_to_v2_payload({}, CloneConfig(title="Bare")))
+        assert payload["pricing"]["priceCatalogCurrencies"] == [
+            {"priceCatalogId": 51493, "currencies": ["EUR"], "defaultCurrency": "EUR"},
+        ]
+        assert [info["type"] for info in payload["mainPaxInfo"]] == [
+            "FIRST_NAME", "LAST_NAME", "EMAIL",
+        ]
+        assert payload["meetingType"]["meetingPointAddresses"] == []
+        assert "flags" not in payload
+
+    def test_payload_shares_no_containers_with_source(self):
+        """Test every dict and list in the payload is new, not the source's."""
+        source = copy.deepcopy(SOURCE)
+        payload = _map_v1_to_v2_payload(source, CloneConfig(title="Aurora Camp Ivalo"))
+
+        assert payload["flags"] is not source["flags"]
+        source_ids = {id(c) for c in _containers(source)}
+        assert not [c for c in _containers(payload) if id(c) in source_ids]
+
+        payload["flags"].append("EDITED")
+        assert source["flags"] == ["AURORA", "WINTER"]
+
+    def test_editing_payload_does_not_leak_into_next_clone(self):
+        """Test mutating one payload's default blocks leaves later payloads intact."""
+        config = CloneConfig(title="Bare")
+        first = _map_v1_to_v2_payload({}, config)
+        first["pricing"]["priceCatalogCurrencies"][0]["currencies"].append("USD")
+        first["mainPaxInfo"][0]["required"] = False
+        first["combo"]["isCombo"] = True
+
+        second = _map_v1_to_v2_payload({}, config)
+        assert second["pricing"]["priceCatalogCurrencies"][0]["currencies"] == ["EUR"]
+        assert second["mainPaxInfo"][0]["required"] is True
+        assert second["combo"] == {"isCombo": False}
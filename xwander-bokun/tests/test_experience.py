@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Unit tests for experience management
+
+Run with: python3 -m pytest tests/test_experience.py -v
+"""
+
+import json
+
+import httpx
+
+from xwander_bokun import ExperienceManager
+
+COMPONENTS_PATH = "/restapi/v2.0/experience/123/components"
+
+
+class _ComponentsServer:
+    """Minimal components endpoint that stores PUT values as the server would."""
+
+    def __init__(self, components):
+        self.components = components
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path == COMPONENTS_PATH
+        self.requests.append(request.method)
+        if request.method == "PUT":
+            for key, value in json.loads(request.content).items():
+                # The server keeps flags sorted, unlike the order they were sent in
+                self.components[key] = sorted(value) if key == "flags" else value
+            return httpx.Response(200, json={"id": 123})
+        return httpx.Response(200, json=self.components)
+
+
+class TestComponentUpdates:
+    """Test no-op skipping and cache invalidation for component updates."""
+
+    async def test_skips_update_already_set(self, make_client):
+        """Test an update matching the cached component sends no PUT."""
+        server = _ComponentsServer({"flags": ["AURORA", "WINTER"]})
+        manager = ExperienceManager(make_client(server))
+
+        await manager.get_components(123, ["FLAGS"])
+        result = await manager.update_flags(123, ["WINTER", "AURORA"])
+
+        assert result["noop"] is True
+        assert server.requests == ["GET"]
+
+    async def test_force_sends_update(self, make_client):
+        """Test force=True sends the PUT even when nothing changed."""
+        server = _ComponentsServer({"flags": ["AURORA"]})
+        manager = ExperienceManager(make_client(server))
+
+        await manager.get_components(123, ["FLAGS"])
+        await manager.update_flags(123, ["AURORA"], force=True)
+
+        assert server.requests == ["GET", "PUT"]
+
+    async def test_update_without_cached_component(self, make_client):
+        """Test an update is sent when the component has not been read."""
+        server = _ComponentsServer({"flags": ["AURORA"]})
+        manager = ExperienceManager(make_client(server))
+
+        await manager.update_flags(123, ["AURORA"])
+
+        assert server.requests == ["PUT"]
+
+    async def test_update_invalidates_component(self, make_client):
+        """Test components are read back from the server after an update."""
+        server = _ComponentsServer({"flags": ["AURORA"]})
+        manager = ExperienceManager(make_client(server))
+
+        await manager.get_components(123, ["FLAGS"])
+        await manager.update_flags(123, ["WINTER", "AURORA"])
+        components = await manager.get_components(123, ["FLAGS"])
+
+        assert components == {"flags": ["AURORA", "WINTER"]}
+        assert server.requests == ["GET", "PUT", "GET"]
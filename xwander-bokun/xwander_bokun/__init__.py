@@ -9,21 +9,47 @@ Usage:
         experiences = await client.search_experiences("Aurora")
 """
 
-from .client import BokunClient
-from .experience import ExperienceManager
-from .booking import BookingManager
-from .clone import clone_experience, CloneConfig
-from .models import Experience, Booking, PricingCategory, StartTime
+import importlib
 
 __version__ = "1.0.0"
+
+# Exports are resolved on first access (PEP 562) so importing the models or
+# clone mapping does not pull in httpx until a client is actually needed.
+_EXPORTS = {
+    "BokunClient": ".client",
+    "ExperienceManager": ".experience",
+    "BookingManager": ".booking",
+    "clone_experience": ".clone",
+    "clone_experiences_bulk": ".clone",
+    "CloneConfig": ".clone",
+    "Experience": ".models",
+    "Booking": ".models",
+    "PricingCategory": ".models",
+    "StartTime": ".models",
+}
+
 __all__ = [
     "BokunClient",
     "ExperienceManager",
     "BookingManager",
     "clone_experience",
+    "clone_experiences_bulk",
     "CloneConfig",
     "Experience",
     "Booking",
     "PricingCategory",
     "StartTime",
 ]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
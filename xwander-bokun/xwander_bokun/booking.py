@@ -2,12 +2,16 @@
 Booking management for Bokun.
 """
 
-from typing import Optional, List, Dict, Any
+import asyncio
+import math
+from typing import Optional, List, Dict, Any, TYPE_CHECKING
 from datetime import date
 
-from .client import BokunClient
 from .models import Booking, BookingStatus
 
+if TYPE_CHECKING:
+    from .client import BokunClient
+
 
 class BookingManager:
     """
@@ -20,7 +24,7 @@ class BookingManager:
             print(f"{booking.customer_name}: {booking.product_title}")
     """
 
-    def __init__(self, client: BokunClient):
+    def __init__(self, client: "BokunClient"):
         self.client = client
 
     async def get(self, confirmation_code: str) -> Booking:
@@ -84,10 +88,58 @@ class BookingManager:
             page_size=page_size,
         )
 
-    async def today(self) -> List[Booking]:
-        """Get today's bookings."""
+    async def today(
+        self,
+        page_size: int = 100,
+        max_concurrency: int = 8,
+    ) -> List[Booking]:
+        """
+        Get all of today's bookings.
+
+        The first page reports the total hit count; remaining pages are
+        then fetched concurrently (at most ``max_concurrency`` in flight).
+
+        Args:
+            page_size: Results per page
+            max_concurrency: Maximum simultaneous page requests
+
+        Returns:
+            List of Booking objects
+
+        Raises:
+            ValueError: If page_size is less than 1
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
         today_str = date.today().isoformat()
-        return await self.search(date_from=today_str, date_to=today_str)
+        first = await self.client.search_bookings(
+            date_from=today_str,
+            date_to=today_str,
+            page=0,
+            page_size=page_size,
+        )
+        items = list(first.get("items", []))
+        # Without a hit count, treat the first page as the whole result
+        n_pages = math.ceil((first.get("totalHits") or len(items)) / page_size)
+
+        if n_pages > 1:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def fetch_page(page: int) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.client.search_bookings(
+                        date_from=today_str,
+                        date_to=today_str,
+                        page=page,
+                        page_size=page_size,
+                    )
+
+            results = await asyncio.gather(*(fetch_page(p) for p in range(1, n_pages)))
+            for result in results:
+                items.extend(result.get("items", []))
+
+        return [Booking.from_api_response(item) for item in items]
 
     async def confirmed(
         self,
@@ -18,6 +18,7 @@ from .client import BokunClient
 from .experience import ExperienceManager
 from .booking import BookingManager
 from .clone import clone_experience, clone_for_rovaniemi, CloneConfig
+from .models import Experience
 
 
 def run_async(coro):
@@ -25,6 +26,18 @@ def run_async(coro):
     return asyncio.get_event_loop().run_until_complete(coro)
 
 
+def _experience_json(obj):
+    """JSON encoder hook: summarize Experience objects for search output."""
+    if isinstance(obj, Experience):
+        return {
+            "id": obj.id,
+            "title": obj.title,
+            "duration_hours": obj.duration_hours,
+            "published": obj.published,
+        }
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 @click.group()
 @click.option("--debug", is_flag=True, help="Enable debug output")
 @click.pass_context
@@ -53,23 +66,14 @@ def search_experiences(ctx, query, as_json, limit):
             results = await manager.search(query, page_size=limit)
 
             if as_json:
-                data = [
-                    {
-                        "id": r.id,
-                        "title": r.title,
-                        "duration_hours": r.duration_hours,
-                        "published": r.published,
-                    }
-                    for r in results
-                ]
-                click.echo(json.dumps(data, indent=2))
+                click.echo(json.dumps(results, indent=2, default=_experience_json))
             else:
-                click.echo(f"\nFound {len(results)} experiences")
-                click.echo("-" * 60)
+                lines = [f"\nFound {len(results)} experiences", "-" * 60]
                 for exp in results:
                     status = "Published" if exp.published else "Draft"
-                    click.echo(f"\n{exp.id}: {exp.title}")
-                    click.echo(f"   Duration: {exp.duration_hours}h | Status: {status}")
+                    lines.append(f"\n{exp.id}: {exp.title}")
+                    lines.append(f"   Duration: {exp.duration_hours}h | Status: {status}")
+                click.echo("\n".join(lines))
 
     run_async(_search())
 
@@ -258,11 +262,11 @@ def search_bookings(ctx, date_from, date_to, email, status, as_json, limit):
                     page_size=limit,
                 )
 
-                click.echo(f"\nFound {len(bookings)} bookings")
-                click.echo("-" * 60)
+                lines = [f"\nFound {len(bookings)} bookings", "-" * 60]
                 for b in bookings:
-                    click.echo(f"\n{b.confirmation_code}: {b.product_title}")
-                    click.echo(f"   {b.customer_name} | {b.start_date} | {b.status.value}")
+                    lines.append(f"\n{b.confirmation_code}: {b.product_title}")
+                    lines.append(f"   {b.customer_name} | {b.start_date} | {b.status.value}")
+                click.echo("\n".join(lines))
 
     run_async(_search())
 
@@ -290,12 +294,12 @@ def today_bookings(ctx, as_json):
                 ]
                 click.echo(json.dumps(data, indent=2))
             else:
-                click.echo(f"\nToday's Bookings: {len(bookings)}")
-                click.echo("=" * 60)
+                lines = [f"\nToday's Bookings: {len(bookings)}", "=" * 60]
                 for b in bookings:
-                    click.echo(f"\n{b.confirmation_code}: {b.product_title}")
-                    click.echo(f"   Customer: {b.customer_name}")
-                    click.echo(f"   Status: {b.status.value}")
+                    lines.append(f"\n{b.confirmation_code}: {b.product_title}")
+                    lines.append(f"   Customer: {b.customer_name}")
+                    lines.append(f"   Status: {b.status.value}")
+                click.echo("\n".join(lines))
 
     run_async(_today())
 
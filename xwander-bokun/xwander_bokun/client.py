@@ -4,15 +4,44 @@ Async Bokun API client with HMAC-SHA1 authentication.
 
 import os
 import hmac
-import hashlib
+import json
 import base64
 import asyncio
+import random
+import functools
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Union
 from collections import deque
+from urllib.parse import quote
 
 import httpx
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup (pip install "xwander-bokun[fast]")
+    orjson = None
+
+
+def _encode_json(data: Any) -> bytes:
+    """Encode a request body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_json(content: bytes) -> Any:
+    """Decode a response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+@functools.lru_cache(maxsize=64)
+def _encode_components(components: Tuple[str, ...]) -> str:
+    """Build the componentType query string for a set of components."""
+    return "&".join("componentType=" + quote(c, safe="") for c in components)
+
 
 class RateLimiter:
     """Handle API rate limiting with automatic throttling."""
@@ -25,7 +54,12 @@ class RateLimiter:
 
     async def wait_if_needed(self):
         """Wait if approaching rate limit."""
-        now = asyncio.get_event_loop().time()
+        now = asyncio.get_running_loop().time()
+
+        # Fast path: nothing recorded yet, so nothing to clean or wait for
+        if not self.request_times:
+            self.request_times.append(now)
+            return
 
         # Clean old requests
         while self.request_times and self.request_times[0] < now - self.window_seconds:
@@ -40,8 +74,9 @@ class RateLimiter:
         self.request_times.append(now)
 
     async def handle_429(self):
-        """Handle rate limit with exponential backoff."""
-        await asyncio.sleep(self.backoff_seconds)
+        """Handle rate limit with jittered exponential backoff."""
+        # Jitter keeps concurrent coroutines from retrying in lockstep
+        await asyncio.sleep(self.backoff_seconds * (1 + random.random() * 0.1))
         self.backoff_seconds = min(self.backoff_seconds * 2, 60)
 
     def reset_backoff(self):
@@ -64,11 +99,13 @@ class BokunClient:
         api_secret: Optional[str] = None,
         base_url: str = "https://api.bokun.io",
         debug: bool = False,
+        max_retries: int = 3,
     ):
         self.api_key = api_key or os.getenv("BOKUN_API_KEY") or os.getenv("BOKUN_ACCESS_KEY")
         self.api_secret = api_secret or os.getenv("BOKUN_API_SECRET") or os.getenv("BOKUN_SECRET_KEY")
         self.base_url = base_url
         self.debug = debug
+        self.max_retries = max_retries
         self.rate_limiter = RateLimiter()
         self._client: Optional[httpx.AsyncClient] = None
 
@@ -78,6 +115,8 @@ class BokunClient:
                 "or BOKUN_API_KEY/BOKUN_API_SECRET (environment or constructor)"
             )
 
+        self._secret_bytes = self.api_secret.encode("utf-8")
+
     async def __aenter__(self) -> "BokunClient":
         self._client = httpx.AsyncClient(timeout=30.0)
         return self
@@ -92,11 +131,7 @@ class BokunClient:
         utc_date = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
         message = utc_date + self.api_key + method.upper() + path
 
-        digest = hmac.new(
-            self.api_secret.encode("utf-8"),
-            message.encode("utf-8"),
-            hashlib.sha1,
-        ).digest()
+        digest = hmac.digest(self._secret_bytes, message.encode("utf-8"), "sha1")
 
         signature = base64.b64encode(digest).decode("utf-8")
 
@@ -112,37 +147,46 @@ class BokunClient:
         self,
         method: str,
         path: str,
-        data: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], bytes]] = None,
         params: Optional[Dict[str, Any]] = None,
         retry: bool = True,
     ) -> Dict[str, Any]:
-        """Make authenticated API request."""
+        """
+        Make authenticated API request.
+
+        ``data`` may be a dict or an already JSON-encoded body (bytes).
+        """
         if not self._client:
             raise RuntimeError("Client not initialized. Use 'async with' context.")
 
-        await self.rate_limiter.wait_if_needed()
-
         url = f"{self.base_url}{path}"
-        headers = self._sign_request(method, path)
+        # Encode once up front; retries resend the same bytes
+        content = data if data is None or isinstance(data, bytes) else _encode_json(data)
 
         if self.debug:
             print(f"DEBUG: {method} {url}")
-            if data:
-                import json
-                print(f"DEBUG: Body: {json.dumps(data, indent=2)[:500]}")
+            if content:
+                print(f"DEBUG: Body: {content[:500].decode('utf-8', 'replace')}")
 
-        try:
-            response = await self._client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                json=data,
-                params=params,
-            )
+        attempts = self.max_retries + 1 if retry else 1
 
-            if response.status_code == 429 and retry:
-                await self.rate_limiter.handle_429()
-                return await self.request(method, path, data, params, retry=False)
+        try:
+            for attempt in range(attempts):
+                await self.rate_limiter.wait_if_needed()
+
+                # Re-sign each attempt: the signature covers the current date
+                response = await self._client.request(
+                    method=method,
+                    url=url,
+                    headers=self._sign_request(method, path),
+                    content=content,
+                    params=params,
+                )
+
+                if response.status_code == 429 and attempt < attempts - 1:
+                    await self.rate_limiter.handle_429()
+                    continue
+                break
 
             response.raise_for_status()
             self.rate_limiter.reset_backoff()
@@ -150,7 +194,7 @@ class BokunClient:
             if self.debug and response.text:
                 print(f"DEBUG: Response: {response.text[:500]}...")
 
-            return response.json() if response.text else {}
+            return _decode_json(response.content) if response.content else {}
 
         except httpx.HTTPStatusError as e:
             if self.debug:
@@ -163,11 +207,11 @@ class BokunClient:
         """GET request."""
         return await self.request("GET", path, params=params)
 
-    async def post(self, path: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def post(self, path: str, data: Union[Dict[str, Any], bytes]) -> Dict[str, Any]:
         """POST request."""
         return await self.request("POST", path, data=data)
 
-    async def put(self, path: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def put(self, path: str, data: Union[Dict[str, Any], bytes]) -> Dict[str, Any]:
         """PUT request."""
         return await self.request("PUT", path, data=data)
 
@@ -200,8 +244,8 @@ class BokunClient:
         """Get experience components via v2.0 API."""
         path = f"/restapi/v2.0/experience/{experience_id}/components"
         if components:
-            params = "&".join(f"componentType={c}" for c in components)
-            path += f"?{params}"
+            # Query stays in the path: Bokun signs path + query string
+            path += f"?{_encode_components(tuple(components))}"
         return await self.get(path)
 
     async def update_experience_components(
@@ -215,8 +259,8 @@ class BokunClient:
             components_data,
         )
 
-    async def create_experience(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create new experience via v2.0 API."""
+    async def create_experience(self, data: Union[Dict[str, Any], bytes]) -> Dict[str, Any]:
+        """Create new experience via v2.0 API (dict or pre-encoded JSON bytes)."""
         return await self.post("/restapi/v2.0/experience", data)
 
     async def search_bookings(
@@ -250,8 +294,12 @@ class BokunClient:
     async def get_booking(self, confirmation_code: str) -> Dict[str, Any]:
         """Get booking by confirmation code."""
         # Remove XWA- prefix if present
-        code = confirmation_code.replace("XWA-", "") if confirmation_code.startswith("XWA-") else confirmation_code
-        result = await self.post("/booking.json/booking-search", {"confirmationCode": code})
+        code = confirmation_code[4:] if confirmation_code.startswith("XWA-") else confirmation_code
+        # Confirmation codes are unique, so a single-item page is enough
+        result = await self.post(
+            "/booking.json/booking-search",
+            {"confirmationCode": code, "page": 0, "pageSize": 1},
+        )
         items = result.get("items", [])
         if not items:
             raise ValueError(f"Booking {confirmation_code} not found")
@@ -5,19 +5,93 @@ Clone existing experiences with modified fields for new locations/variants.
 Uses Bokun API v2.0 ExperienceComponentsDto schema.
 """
 
-import copy
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
-
-from .client import BokunClient
-
-
-@dataclass
+import asyncio
+import functools
+import string
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Tuple, Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import BokunClient
+
+
+# Shared value for required-but-empty array fields (serializes as [])
+_EMPTY: Tuple[()] = ()
+
+# Static v2.0 payload fragments. Copied into each payload so callers can
+# mutate the result without affecting later clones.
+_DEFAULT_COMBO = {"isCombo": False}
+_DEFAULT_BOX_SETTINGS = {"isBox": False}
+_DEFAULT_PRICE_CATALOG_CURRENCY = {
+    "priceCatalogId": 51493,
+    "currencies": ("EUR",),
+    "defaultCurrency": "EUR",
+}
+_DEFAULT_MAIN_PAX_INFO = (
+    {"type": "FIRST_NAME", "required": True, "requiredBeforeDeparture": False},
+    {"type": "LAST_NAME", "required": True, "requiredBeforeDeparture": False},
+    {"type": "EMAIL", "required": True, "requiredBeforeDeparture": False},
+)
+
+
+# Field mapping tables for _map_v1_to_v2_payload.
+# Required scalars: (payload key, source key, default)
+_REQUIRED_FIELDS = (
+    ("type", "activityType", "DAY_TOUR_OR_ACTIVITY"),
+    ("bookingType", "bookingType", "DATE_AND_TIME"),
+    ("capacityType", "capacityType", "ON_REQUEST"),
+    ("timeZone", "timeZone", "Europe/Helsinki"),
+)
+# Overridable text: (CloneConfig attribute, source key, payload key).
+# A set config value wins; otherwise a non-empty source value is copied.
+_TEXT_FIELDS = (
+    ("new_description", "description", "description"),
+    ("new_excerpt", "excerpt", "shortDescription"),
+)
+# Optional scalars copied when non-empty: (payload key, source key)
+_OPTIONAL_FIELDS = (
+    ("difficultyLevel", "difficultyLevel"),
+    ("minAge", "minAge"),
+)
+# Scalars always copied with a default: (payload key, source key, default)
+_DEFAULTED_FIELDS = (
+    ("privateExperience", "privateActivity", False),
+    ("allowCustomizedBookings", "allowCustomizedBookings", False),
+    ("marketplaceVisibilityType", "marketplaceVisibilityType", "PRIVATE"),
+)
+# Fixed-shape blocks: (block key, source key, default)
+_DURATION_BLOCK = (
+    ("hours", "durationHours", 0),
+    ("minutes", "durationMinutes", 0),
+    ("days", "durationDays", 0),
+    ("weeks", "durationWeeks", 0),
+)
+_CUTOFF_BLOCK = (
+    ("type", "cutoffType", "RELATIVE_TO_START_TIME"),
+    ("minutes", "bookingCutoffMinutes", 0),
+    ("hours", "bookingCutoffHours", 0),
+    ("days", "bookingCutoffDays", 0),
+    ("weeks", "bookingCutoffWeeks", 8),
+)
+_ON_REQUEST_DEADLINE_BLOCK = (
+    ("minutes", "requestDeadlineMinutes", 0),
+    ("hours", "requestDeadlineHours", 0),
+    ("days", "requestDeadlineDays", 3),
+    ("weeks", "requestDeadlineWeeks", 0),
+)
+_TICKET_BLOCK = (
+    ("ticketPerPerson", "ticketPerPerson", False),
+    ("barcodeFormat", "barcodeType", "QR_CODE"),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class CloneConfig:
     """
     Configuration for cloning an experience.
 
-    Specify which fields to modify in the cloned product.
+    Specify which fields to modify in the cloned product. Instances are
+    immutable and hashable; use ``dataclasses.replace`` to derive variants.
     """
 
     # Required: new title
@@ -41,14 +115,92 @@ class CloneConfig:
     new_duration_hours: Optional[int] = None
 
     # Additional flags to add
-    add_flags: List[str] = field(default_factory=list)
+    add_flags: Tuple[str, ...] = ()
 
     # Keywords to add
-    add_keywords: List[str] = field(default_factory=list)
+    add_keywords: Tuple[str, ...] = ()
 
     # Keep as unpublished (default: True for safety)
     keep_unpublished: bool = True
 
+    def __post_init__(self):
+        # Accept any iterable (e.g. lists) but store tuples to stay hashable
+        object.__setattr__(self, "add_flags", tuple(self.add_flags))
+        object.__setattr__(self, "add_keywords", tuple(self.add_keywords))
+
+
+# Space -> dash and ASCII upper -> lower in one translate pass
+_SLUG_TABLE = str.maketrans({" ": "-", **{c: c.lower() for c in string.ascii_uppercase}})
+
+
+def _slugify(title: str) -> str:
+    """Slug for externalIds: spaces to dashes, lowercased."""
+    if title.isascii():
+        return title.translate(_SLUG_TABLE)
+    # Non-ASCII titles (e.g. "Äkäslompolo") need full Unicode lowercasing
+    return title.replace(" ", "-").lower()
+
+
+@dataclass(frozen=True, slots=True)
+class _ConfigSpec:
+    """Config-only parts of a clone payload, computed once per CloneConfig."""
+
+    rate_external_id: str
+    # (key, value) pairs; expanded into fresh dicts for each payload
+    duration_override: Optional[Tuple[Tuple[str, int], ...]]
+    location_coordinates: Tuple[Tuple[str, Any], ...]
+    meeting_point_title: Optional[str]
+    meeting_point_address: Tuple[Tuple[str, Any], ...]
+
+
+@functools.lru_cache(maxsize=64)
+def _specialize(config: CloneConfig) -> _ConfigSpec:
+    """
+    Partially evaluate the config-dependent branches of the mapper.
+
+    Bulk clones typically reuse one CloneConfig for many sources, so the
+    values derived purely from it are computed once and cached.
+    """
+    has_coordinates = bool(config.new_latitude and config.new_longitude)
+    location_coordinates = (
+        (("latitude", config.new_latitude), ("longitude", config.new_longitude))
+        if has_coordinates else ()
+    )
+
+    meeting_point_title = None
+    meeting_point_address = ()
+    if config.new_city and has_coordinates:
+        meeting_point_title = config.new_start_point_title or f"Meeting Point - {config.new_city}"
+        meeting_point_address = (
+            ("addressLine1", config.new_address_line1 or ""),
+            ("city", config.new_city),
+            ("postalCode", config.new_postal_code or ""),
+            ("countryCode", "FI"),
+            *location_coordinates,
+        )
+
+    duration_override = None
+    if config.new_duration_hours is not None:
+        duration_override = (
+            ("hours", config.new_duration_hours),
+            ("minutes", 0),
+            ("days", 0),
+            ("weeks", 0),
+        )
+
+    return _ConfigSpec(
+        rate_external_id=f"rate-default-{_slugify(config.title)}",
+        duration_override=duration_override,
+        location_coordinates=location_coordinates,
+        meeting_point_title=meeting_point_title,
+        meeting_point_address=meeting_point_address,
+    )
+
+
+def _map_block(get: Callable[..., Any], fields: Tuple[Tuple[str, str, Any], ...]) -> Dict[str, Any]:
+    """Build a fixed-shape sub-payload from a (key, source key, default) table."""
+    return {key: get(source_key, default) for key, source_key, default in fields}
+
 
 def _map_v1_to_v2_payload(
     source_data: Dict[str, Any],
@@ -62,106 +214,69 @@ def _map_v1_to_v2_payload(
         config: Clone configuration with modifications
 
     Returns:
-        Payload ready for POST /restapi/v2.0/experience
+        Payload ready for POST /restapi/v2.0/experience. Every dict and list
+        in it is built fresh (only immutable values are shared with
+        source_data), so it is safe to mutate without defensive copies.
+        Required-but-empty arrays are the shared empty tuple; assign a new
+        list to fill one rather than appending.
     """
-    # Extract source values
-    source_activity_type = source_data.get("activityType", "DAY_TOUR_OR_ACTIVITY")
-    source_booking_type = source_data.get("bookingType", "DATE_AND_TIME")
-    source_capacity_type = source_data.get("capacityType", "ON_REQUEST")
-    source_time_zone = source_data.get("timeZone", "Europe/Helsinki")
-
-    # Build v2.0 payload with required fields
-    payload = {
-        # Required: title
-        "title": config.title,
-
-        # Required: experience type
-        "type": source_activity_type,
-
-        # Required: booking type
-        "bookingType": source_booking_type,
-
-        # Required: capacity type
-        "capacityType": source_capacity_type,
-
-        # Time zone
-        "timeZone": source_time_zone,
-    }
-
-    # Description
-    if config.new_description:
-        payload["description"] = config.new_description
-    elif source_data.get("description"):
-        payload["description"] = source_data["description"]
-
-    # Short description / excerpt
-    if config.new_excerpt:
-        payload["shortDescription"] = config.new_excerpt
-    elif source_data.get("excerpt"):
-        payload["shortDescription"] = source_data["excerpt"]
+    spec = _specialize(config)
+
+    # Extract source values once; the mapping below works on these locals
+    get = source_data.get
+    source_flags = get("flags") or ()
+    source_keywords = get("keywords") or ()
+    source_start_times = get("startTimes") or ()
+    source_pricing_categories = get("pricingCategories") or ()
+    source_rates = get("rates") or ()
+    source_cancel_policy = get("cancellationPolicy")
+    source_price_catalogs = get("activityPriceCatalogs") or ()
+    source_main_contact = get("mainContactFields") or ()
+    source_google_place = get("googlePlace") or {}
+    source_start_points = get("startPoints") or ()
+
+    # Required fields: title, experience type, booking type, capacity type, time zone
+    payload = {"title": config.title}
+    for key, source_key, default in _REQUIRED_FIELDS:
+        payload[key] = get(source_key, default)
+    source_capacity_type = payload["capacityType"]
+
+    # Description / short description: config override, else source value
+    for attr, source_key, key in _TEXT_FIELDS:
+        value = getattr(config, attr) or get(source_key)
+        if value:
+            payload[key] = value
 
     # Duration
-    duration_data = {}
-    if config.new_duration_hours is not None:
-        duration_data["hours"] = config.new_duration_hours
-        duration_data["minutes"] = 0
-        duration_data["days"] = 0
-        duration_data["weeks"] = 0
-    elif source_data.get("durationHours") is not None:
-        duration_data["hours"] = source_data.get("durationHours", 0)
-        duration_data["minutes"] = source_data.get("durationMinutes", 0)
-        duration_data["days"] = source_data.get("durationDays", 0)
-        duration_data["weeks"] = source_data.get("durationWeeks", 0)
-
-    if duration_data:
-        payload["duration"] = duration_data
-
-    # Difficulty level
-    if source_data.get("difficultyLevel"):
-        payload["difficultyLevel"] = source_data["difficultyLevel"]
-
-    # Min age
-    if source_data.get("minAge"):
-        payload["minAge"] = source_data["minAge"]
-
-    # Flags
-    flags = list(source_data.get("flags", []))
-    for flag in config.add_flags:
-        if flag not in flags:
-            flags.append(flag)
+    if spec.duration_override is not None:
+        payload["duration"] = dict(spec.duration_override)
+    elif get("durationHours") is not None:
+        payload["duration"] = _map_block(get, _DURATION_BLOCK)
+
+    # Difficulty level, min age
+    for key, source_key in _OPTIONAL_FIELDS:
+        value = get(source_key)
+        if value:
+            payload[key] = value
+
+    # Flags (ordered dedup: source first, then additions)
+    flags = list(dict.fromkeys((*source_flags, *config.add_flags)))
     if flags:
         payload["flags"] = flags
 
     # Keywords
-    keywords = list(source_data.get("keywords", []))
-    for keyword in config.add_keywords:
-        if keyword not in keywords:
-            keywords.append(keyword)
+    keywords = list(dict.fromkeys((*source_keywords, *config.add_keywords)))
     if keywords:
         payload["keywords"] = keywords
 
     # Cutoff settings
-    cutoff = {
-        "type": source_data.get("cutoffType", "RELATIVE_TO_START_TIME"),
-        "minutes": source_data.get("bookingCutoffMinutes", 0),
-        "hours": source_data.get("bookingCutoffHours", 0),
-        "days": source_data.get("bookingCutoffDays", 0),
-        "weeks": source_data.get("bookingCutoffWeeks", 8),
-    }
-    payload["cutoff"] = cutoff
+    payload["cutoff"] = _map_block(get, _CUTOFF_BLOCK)
 
     # On-request deadline (if on-request capacity)
     if source_capacity_type == "ON_REQUEST":
-        on_request_deadline = {
-            "minutes": source_data.get("requestDeadlineMinutes", 0),
-            "hours": source_data.get("requestDeadlineHours", 0),
-            "days": source_data.get("requestDeadlineDays", 3),
-            "weeks": source_data.get("requestDeadlineWeeks", 0),
-        }
-        payload["onRequestDeadline"] = on_request_deadline
+        payload["onRequestDeadline"] = _map_block(get, _ON_REQUEST_DEADLINE_BLOCK)
 
     # Start times - v2.0 uses flat duration fields
-    source_start_times = source_data.get("startTimes", [])
     if source_start_times:
         start_times = []
         for st in source_start_times:
@@ -182,35 +297,39 @@ def _map_v1_to_v2_payload(
         payload["startTimes"] = start_times
 
     # Pricing categories (required) - reference existing vendor-level categories by ID
-    source_pricing_categories = source_data.get("pricingCategories", [])
+    # Single pass collects IDs and the flagged default; first ID is the fallback
     pricing_category_ids = []
     default_category_id = None
 
     for pc in source_pricing_categories:
         cat_id = pc.get("id")
-        if cat_id:
-            pricing_category_ids.append(cat_id)
-            if pc.get("defaultCategory"):
-                default_category_id = cat_id
-
-    if not default_category_id and pricing_category_ids:
-        default_category_id = pricing_category_ids[0]
+        if not cat_id:
+            continue
+        pricing_category_ids.append(cat_id)
+        if pc.get("defaultCategory"):
+            default_category_id = cat_id
 
     if pricing_category_ids:
         payload["pricingCategories"] = {
             "ids": pricing_category_ids,
-            "defaultId": default_category_id,
+            "defaultId": default_category_id or pricing_category_ids[0],
         }
 
     # Rates (required) - define rate configurations
-    source_rates = source_data.get("rates", [])
     rates_list = []
-    default_rate_idx = None
 
-    default_rate_external_id = f"rate-default-{config.title.replace(' ', '-').lower()}"
+    default_rate_external_id = spec.rate_external_id
+    source_cancel_policy_id = (source_cancel_policy or {}).get("id")
 
     for idx, rate in enumerate(source_rates):
-        rate_data = {
+        # Cancellation policy ID (rate-level policy overrides the product's)
+        rate_cancel_policy = rate.get("cancellationPolicy")
+        cancel_policy_id = (
+            rate_cancel_policy.get("id") if rate_cancel_policy else source_cancel_policy_id
+        )
+
+        # Conditional keys are resolved first so each rate is one dict literal
+        rates_list.append({
             "title": rate.get("title", "Standard"),
             "minPerBooking": rate.get("minPerBooking", 1),
             "pricedPerPerson": rate.get("pricedPerPerson", True),
@@ -219,18 +338,10 @@ def _map_v1_to_v2_payload(
             "pickupSelectionType": "UNAVAILABLE",
             "dropoffSelectionType": "UNAVAILABLE",
             "tieredPricingEnabled": rate.get("tieredPricingEnabled", False),
-        }
-
-        # Assign externalId to first rate for referencing
-        if idx == 0:
-            rate_data["externalId"] = default_rate_external_id
-
-        # Cancellation policy ID
-        cancel_policy = rate.get("cancellationPolicy") or source_data.get("cancellationPolicy")
-        if cancel_policy and cancel_policy.get("id"):
-            rate_data["cancellationPolicyId"] = cancel_policy["id"]
-
-        rates_list.append(rate_data)
+            # Assign externalId to first rate for referencing
+            **({"externalId": default_rate_external_id} if idx == 0 else {}),
+            **({"cancellationPolicyId": cancel_policy_id} if cancel_policy_id else {}),
+        })
 
     if rates_list:
         payload["rates"] = {
@@ -240,76 +351,71 @@ def _map_v1_to_v2_payload(
         }
 
     # Pricing (required) - price catalog configuration
-    source_price_catalogs = source_data.get("activityPriceCatalogs", [])
     price_catalog_currencies = []
 
     for cat in source_price_catalogs:
-        catalog_id = cat.get("catalogId") or cat.get("catalog", {}).get("id")
+        catalog_id = cat.get("catalogId") or (cat.get("catalog") or {}).get("id")
+        if not catalog_id:
+            continue
+
         currencies = []
         default_currency = "EUR"
-        for curr in cat.get("currencies", []):
-            currencies.append(curr.get("currency", "EUR"))
+        for curr in cat.get("currencies") or ():
+            currency = curr.get("currency", "EUR")
+            currencies.append(currency)
             if curr.get("default"):
-                default_currency = curr.get("currency", "EUR")
+                default_currency = currency
 
-        if catalog_id:
-            price_catalog_currencies.append({
-                "priceCatalogId": catalog_id,
-                "currencies": currencies or ["EUR"],
-                "defaultCurrency": default_currency,
-            })
+        price_catalog_currencies.append({
+            "priceCatalogId": catalog_id,
+            "currencies": currencies or ["EUR"],
+            "defaultCurrency": default_currency,
+        })
 
     payload["pricing"] = {
-        "experiencePriceRules": [],  # Empty for now, prices set via UI
-        "extraPriceRules": [],
-        "pickupPriceRules": [],
-        "dropoffPriceRules": [],
-        "priceCatalogCurrencies": price_catalog_currencies if price_catalog_currencies else [
-            {"priceCatalogId": 51493, "currencies": ["EUR"], "defaultCurrency": "EUR"}
+        "experiencePriceRules": _EMPTY,  # Empty for now, prices set via UI
+        "extraPriceRules": _EMPTY,
+        "pickupPriceRules": _EMPTY,
+        "dropoffPriceRules": _EMPTY,
+        "priceCatalogCurrencies": price_catalog_currencies or [
+            {
+                **_DEFAULT_PRICE_CATALOG_CURRENCY,
+                "currencies": list(_DEFAULT_PRICE_CATALOG_CURRENCY["currencies"]),
+            }
         ],
     }
 
     # Combo settings (required) - empty for non-combo products
-    payload["combo"] = {
-        "isCombo": False,
-    }
+    payload["combo"] = dict(_DEFAULT_COMBO)
 
     # Main pax info (required) - ContactInformationDto uses "type" not "field"
-    source_main_contact = source_data.get("mainContactFields", [])
-    main_pax_info = []
-    for contact in source_main_contact:
-        field_type = contact.get("field", "FIRST_NAME")
-        main_pax_info.append({
-            "type": field_type,
+    main_pax_info = [
+        {
+            "type": contact.get("field", "FIRST_NAME"),
             "required": contact.get("required", True),
             "requiredBeforeDeparture": contact.get("requiredBeforeDeparture", False),
-        })
+        }
+        for contact in source_main_contact
+    ]
 
     if not main_pax_info:
         # Default required fields
-        main_pax_info = [
-            {"type": "FIRST_NAME", "required": True, "requiredBeforeDeparture": False},
-            {"type": "LAST_NAME", "required": True, "requiredBeforeDeparture": False},
-            {"type": "EMAIL", "required": True, "requiredBeforeDeparture": False},
-        ]
+        main_pax_info = [dict(info) for info in _DEFAULT_MAIN_PAX_INFO]
 
     payload["mainPaxInfo"] = main_pax_info
-    payload["otherPaxInfo"] = []  # Empty but required
+    payload["otherPaxInfo"] = _EMPTY  # Empty but required
 
     # Location (GooglePlaceDto) - valid fields: state, placeId, countryCode, lookupLang, id, latitude, longitude, city, name
     if config.new_city or config.new_latitude:
-        city = config.new_city or source_data.get("googlePlace", {}).get("city", "Rovaniemi")
-        location = {
+        city = config.new_city or source_google_place.get("city", "Rovaniemi")
+        payload["location"] = {
             "countryCode": "FI",
             "city": city,
             "name": f"{city}, Finland",
+            **dict(spec.location_coordinates),
         }
-        if config.new_latitude and config.new_longitude:
-            location["latitude"] = config.new_latitude
-            location["longitude"] = config.new_longitude
-        payload["location"] = location
-    elif source_data.get("googlePlace"):
-        gp = source_data["googlePlace"]
+    elif source_google_place:
+        gp = source_google_place
         location = {
             "countryCode": gp.get("countryCode", "FI"),
             "city": gp.get("city", ""),
@@ -324,45 +430,31 @@ def _map_v1_to_v2_payload(
 
     # Availability rules (required, but can be empty for draft)
     # For a new product, we start with empty rules
-    payload["availabilityRules"] = []
+    payload["availabilityRules"] = _EMPTY
 
     # Note: guidanceTypes omitted for initial creation due to complex structure
     # Can be updated via PUT after creation if needed
 
     # Box settings (required) - set isBox to false for non-boxed products
-    payload["boxSettings"] = {
-        "isBox": False,
-    }
+    payload["boxSettings"] = dict(_DEFAULT_BOX_SETTINGS)
 
     # Ticket settings (required) - uses barcodeFormat not barcodeType
-    payload["ticket"] = {
-        "ticketPerPerson": source_data.get("ticketPerPerson", False),
-        "barcodeFormat": source_data.get("barcodeType", "QR_CODE"),
-    }
-
-    # Private experience flag (required)
-    payload["privateExperience"] = source_data.get("privateActivity", False)
+    payload["ticket"] = _map_block(get, _TICKET_BLOCK)
 
-    # Allow customized bookings (required)
-    payload["allowCustomizedBookings"] = source_data.get("allowCustomizedBookings", False)
+    # Private experience flag, customized bookings (required), marketplace visibility
+    for key, source_key, default in _DEFAULTED_FIELDS:
+        payload[key] = get(source_key, default)
 
     # Meeting type settings (required) - uses "type" not "meetingType"
     # ExperienceMeetingPointDto has: title, id, address (nested)
     meeting_point_addresses = []
-    if config.new_city and config.new_latitude and config.new_longitude:
+    if spec.meeting_point_title is not None:
         meeting_point_addresses.append({
-            "title": config.new_start_point_title or f"Meeting Point - {config.new_city}",
-            "address": {
-                "addressLine1": config.new_address_line1 or "",
-                "city": config.new_city,
-                "postalCode": config.new_postal_code or "",
-                "countryCode": "FI",
-                "latitude": config.new_latitude,
-                "longitude": config.new_longitude,
-            }
+            "title": spec.meeting_point_title,
+            "address": dict(spec.meeting_point_address),
         })
-    elif source_data.get("startPoints"):
-        for sp in source_data["startPoints"]:
+    elif source_start_points:
+        for sp in source_start_points:
             addr = sp.get("address", {})
             geo = addr.get("geoPoint", {})
             meeting_point_addresses.append({
@@ -379,9 +471,9 @@ def _map_v1_to_v2_payload(
 
     # For MEET_ON_LOCATION, only send basic fields
     payload["meetingType"] = {
-        "type": source_data.get("meetingType", "MEET_ON_LOCATION"),
+        "type": get("meetingType", "MEET_ON_LOCATION"),
         "meetingPointAddresses": meeting_point_addresses,
-        "dropoffService": source_data.get("dropoffService", False),
+        "dropoffService": get("dropoffService", False),
     }
 
     # Activation / publishing status - uses "activated" not "published"
@@ -389,14 +481,11 @@ def _map_v1_to_v2_payload(
         "activated": not config.keep_unpublished,
     }
 
-    # Marketplace visibility
-    payload["marketplaceVisibilityType"] = source_data.get("marketplaceVisibilityType", "PRIVATE")
-
     return payload
 
 
 async def clone_experience(
-    client: BokunClient,
+    client: "BokunClient",
     source_id: int,
     config: CloneConfig,
     dry_run: bool = False,
@@ -440,8 +529,58 @@ async def clone_experience(
     return result
 
 
+async def clone_experiences_bulk(
+    client: "BokunClient",
+    specs: List[Tuple[int, CloneConfig]],
+    dry_run: bool = False,
+    concurrency: int = 8,
+) -> List[Dict[str, Any]]:
+    """
+    Clone several experiences concurrently.
+
+    All source experiences are fetched in parallel, mapped to v2.0 payloads,
+    then created in parallel. At most ``concurrency`` requests are in flight.
+
+    Args:
+        client: Initialized BokunClient
+        specs: (source_id, config) pairs to clone
+        dry_run: If True, return payloads without creating
+        concurrency: Maximum simultaneous API requests
+
+    Returns:
+        Created experience data (or payloads if dry_run), in ``specs`` order
+
+    Example:
+        async with BokunClient() as client:
+            results = await clone_experiences_bulk(client, [
+                (1107193, CloneConfig(title="Aurora Camp Rovaniemi", new_city="Rovaniemi")),
+                (1107194, CloneConfig(title="Aurora Camp Inari", new_city="Inari")),
+            ])
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(coro):
+        async with semaphore:
+            return await coro
+
+    sources = await asyncio.gather(
+        *(bounded(client.get_experience(source_id)) for source_id, _ in specs)
+    )
+    payloads = [
+        _map_v1_to_v2_payload(source_data, config)
+        for source_data, (_, config) in zip(sources, specs)
+    ]
+
+    if dry_run:
+        return [{"dry_run": True, "payload": payload} for payload in payloads]
+
+    return list(await asyncio.gather(
+        *(bounded(client.create_experience(payload)) for payload in payloads)
+    ))
+
+
 async def clone_for_rovaniemi(
-    client: BokunClient,
+    client: "BokunClient",
     source_id: int,
     title: str,
     description: Optional[str] = None,
@@ -469,8 +608,8 @@ async def clone_for_rovaniemi(
         new_longitude=25.7294,
         new_start_point_title="Xwander Nordic - Rovaniemi",
         new_description=description,
-        add_flags=["NORTHERN_LIGHTS"],
-        add_keywords=["rovaniemi", "aurora", "northern lights"],
+        add_flags=("NORTHERN_LIGHTS",),
+        add_keywords=("rovaniemi", "aurora", "northern lights"),
         keep_unpublished=True,
     )
 
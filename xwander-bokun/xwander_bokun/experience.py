@@ -2,11 +2,31 @@
 Experience/Product management for Bokun.
 """
 
-from typing import Optional, List, Dict, Any
+import asyncio
+import copy
+import time
+from typing import Optional, List, Dict, Any, Iterable, Tuple, TYPE_CHECKING
 
-from .client import BokunClient
 from .models import Experience
 
+if TYPE_CHECKING:
+    from .client import BokunClient
+
+_MISSING = object()
+
+
+def _component_key(component_type: str) -> str:
+    """Map a componentType name (START_TIMES) to its response key (startTimes)."""
+    head, *rest = component_type.lower().split("_")
+    return head + "".join(part.capitalize() for part in rest)
+
+
+def _same_value(current: Any, target: Any) -> bool:
+    """Compare component values; lists (flags) compare as sets."""
+    if isinstance(current, list) and isinstance(target, list):
+        return set(current) == set(target)
+    return current == target
+
 
 class ExperienceManager:
     """
@@ -17,19 +37,88 @@ class ExperienceManager:
             manager = ExperienceManager(client)
             exp = await manager.get(1107193)
             print(exp.title)
+
+    Experience and component reads are cached for ``cache_ttl`` seconds;
+    updates made through the manager invalidate the affected entries.
     """
 
-    def __init__(self, client: BokunClient):
+    def __init__(self, client: "BokunClient", cache_ttl: float = 30.0):
         self.client = client
+        self.cache_ttl = cache_ttl
+        self._get_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+        # One flat dict keyed by (component key, experience ID)
+        self._component_cache: Dict[Tuple[str, int], Tuple[float, Any]] = {}
 
     async def get(self, experience_id: int) -> Experience:
         """Get experience by ID."""
-        data = await self.client.get_experience(experience_id)
+        data = await self.get_raw(experience_id)
         return Experience.from_api_response(data)
 
     async def get_raw(self, experience_id: int) -> Dict[str, Any]:
         """Get raw experience data (for cloning)."""
-        return await self.client.get_experience(experience_id)
+        cached = self._get_cache.get(experience_id)
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return copy.deepcopy(cached[1])
+
+        data = await self.client.get_experience(experience_id)
+        self._get_cache[experience_id] = (time.monotonic(), data)
+        # Callers get their own copy so mutations never reach the cache
+        return copy.deepcopy(data)
+
+    async def preload(self, experience_ids: Iterable[int]) -> None:
+        """Fetch several experiences concurrently and populate the cache."""
+        await asyncio.gather(*(self.get_raw(eid) for eid in set(experience_ids)))
+
+    def invalidate(self, experience_id: Optional[int] = None) -> None:
+        """Drop one cached experience, or the whole cache if no ID given."""
+        if experience_id is None:
+            self._get_cache.clear()
+            self._component_cache.clear()
+        else:
+            self._get_cache.pop(experience_id, None)
+            for key in [k for k in self._component_cache if k[1] == experience_id]:
+                del self._component_cache[key]
+
+    def _cached_component(self, experience_id: int, key: str) -> Any:
+        """Return a fresh cached component value, or _MISSING."""
+        cached = self._component_cache.get((key, experience_id))
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
+        return _MISSING
+
+    async def _update_components(
+        self,
+        experience_id: int,
+        components_data: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Update components and drop the cache entries they touch.
+
+        The PUT body is not cached: the server may normalize what it stores,
+        so only values read back by get_components() are trusted.
+        """
+        result = await self.client.update_experience_components(
+            experience_id,
+            components_data,
+        )
+        self._get_cache.pop(experience_id, None)
+        for key in components_data:
+            self._component_cache.pop((key, experience_id), None)
+        return result
+
+    async def _update_component(
+        self,
+        experience_id: int,
+        key: str,
+        value: Any,
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        """Update one component, skipping the PUT if the cache shows it is already set."""
+        if not force:
+            current = self._cached_component(experience_id, key)
+            if current is not _MISSING and _same_value(current, value):
+                return {key: value, "noop": True}
+        return await self._update_components(experience_id, {key: value})
 
     async def search(
         self,
@@ -39,7 +128,7 @@ class ExperienceManager:
     ) -> List[Experience]:
         """Search experiences."""
         result = await self.client.search_experiences(query, page, page_size)
-        return [Experience.from_api_response(item) for item in result.get("items", [])]
+        return Experience.from_api_responses(result.get("items", []))
 
     async def create(self, experience: Experience) -> Dict[str, Any]:
         """Create new experience."""
@@ -50,11 +139,15 @@ class ExperienceManager:
         """Create experience from raw dictionary (for cloning)."""
         return await self.client.create_experience(data)
 
-    async def update_title(self, experience_id: int, title: str) -> Dict[str, Any]:
-        """Update experience title."""
-        return await self.client.update_experience_components(
-            experience_id,
-            {"title": {"value": title}},
+    async def update_title(
+        self,
+        experience_id: int,
+        title: str,
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        """Update experience title (no-op if already set, unless force)."""
+        return await self._update_component(
+            experience_id, "title", {"value": title}, force=force
         )
 
     async def update_description(
@@ -67,7 +160,7 @@ class ExperienceManager:
         data: Dict[str, Any] = {"description": {"value": description}}
         if excerpt:
             data["excerpt"] = {"value": excerpt}
-        return await self.client.update_experience_components(experience_id, data)
+        return await self._update_components(experience_id, data)
 
     async def update_duration(
         self,
@@ -76,7 +169,7 @@ class ExperienceManager:
         minutes: int = 0,
     ) -> Dict[str, Any]:
         """Update experience duration."""
-        return await self.client.update_experience_components(
+        return await self._update_components(
             experience_id,
             {
                 "duration": {
@@ -92,43 +185,52 @@ class ExperienceManager:
         self,
         experience_id: int,
         flags: List[str],
+        force: bool = False,
     ) -> Dict[str, Any]:
-        """Update experience flags."""
-        return await self.client.update_experience_components(
-            experience_id,
-            {"flags": flags},
-        )
+        """Update experience flags (no-op if already set, unless force)."""
+        return await self._update_component(experience_id, "flags", flags, force=force)
 
-    async def add_flag(self, experience_id: int, flag: str) -> Dict[str, Any]:
-        """Add a flag to experience."""
-        components = await self.client.get_experience_components(
-            experience_id,
-            ["FLAGS"],
-        )
-        current_flags = components.get("flags", [])
-        if flag not in current_flags:
-            current_flags.append(flag)
-            return await self.update_flags(experience_id, current_flags)
-        return {"flags": current_flags}
+    async def add_flag(
+        self,
+        experience_id: int,
+        flag: str,
+        current_flags: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Add a flag to experience.
+
+        Pass ``current_flags`` when the experience is already loaded to skip
+        fetching the FLAGS component.
+        """
+        if current_flags is None:
+            components = await self.get_components(experience_id, ["FLAGS"])
+            current_flags = components.get("flags", [])
+        if flag in current_flags:
+            return {"flags": current_flags}
+        return await self.update_flags(experience_id, [*current_flags, flag])
 
     async def get_components(
         self,
         experience_id: int,
         components: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
-        """Get specific components."""
-        return await self.client.get_experience_components(experience_id, components)
-
-    async def publish(self, experience_id: int) -> Dict[str, Any]:
-        """Publish experience."""
-        return await self.client.update_experience_components(
-            experience_id,
-            {"published": True},
-        )
-
-    async def unpublish(self, experience_id: int) -> Dict[str, Any]:
-        """Unpublish experience."""
-        return await self.client.update_experience_components(
-            experience_id,
-            {"published": False},
-        )
+        """Get specific components (served from cache when all are fresh)."""
+        if components:
+            keys = [_component_key(c) for c in components]
+            values = [self._cached_component(experience_id, k) for k in keys]
+            if _MISSING not in values:
+                return copy.deepcopy(dict(zip(keys, values)))
+
+        data = await self.client.get_experience_components(experience_id, components)
+        now = time.monotonic()
+        for key, value in data.items():
+            self._component_cache[(key, experience_id)] = (now, value)
+        return copy.deepcopy(data)
+
+    async def publish(self, experience_id: int, force: bool = False) -> Dict[str, Any]:
+        """Publish experience (no-op if already published, unless force)."""
+        return await self._update_component(experience_id, "published", True, force=force)
+
+    async def unpublish(self, experience_id: int, force: bool = False) -> Dict[str, Any]:
+        """Unpublish experience (no-op if already unpublished, unless force)."""
+        return await self._update_component(experience_id, "published", False, force=force)
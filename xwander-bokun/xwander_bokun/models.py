@@ -3,9 +3,8 @@ Data models for Bokun API responses.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Sequence
 from decimal import Decimal
-from datetime import datetime
 from enum import Enum
 
 
@@ -32,7 +31,23 @@ class CapacityType(str, Enum):
     ON_REQUEST = "ON_REQUEST"
 
 
-@dataclass
+# Direct value -> member maps; known values skip Enum.__call__, anything
+# else still goes through the constructor so unknown values keep raising.
+_DIFFICULTY_MAP = DifficultyLevel._value2member_map_
+_CAPACITY_MAP = CapacityType._value2member_map_
+_STATUS_MAP = BookingStatus._value2member_map_
+
+
+_DEFAULT_LANG = "en_GB"
+_DEFAULT_TZ = "Europe/Helsinki"
+
+_EMPTY: tuple = ()
+
+_ZERO = Decimal("0")
+_ZERO_AMOUNTS = (None, 0, "0")
+
+
+@dataclass(slots=True)
 class GeoPoint:
     """Geographic coordinates."""
     latitude: float
@@ -42,7 +57,7 @@ class GeoPoint:
         return {"latitude": self.latitude, "longitude": self.longitude}
 
 
-@dataclass
+@dataclass(slots=True)
 class Address:
     """Physical address."""
     address_line1: str
@@ -67,7 +82,7 @@ class Address:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class StartPoint:
     """Experience start location."""
     title: str
@@ -81,7 +96,7 @@ class StartPoint:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class LocationCode:
     """Location code for categorization."""
     country: str
@@ -96,7 +111,7 @@ class LocationCode:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class GooglePlace:
     """Google Place reference."""
     country: str
@@ -118,7 +133,7 @@ class GooglePlace:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class StartTime:
     """Experience start time slot."""
     hour: int
@@ -141,7 +156,7 @@ class StartTime:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PricingCategory:
     """Pricing category (Adult, Child, etc.)."""
     title: str
@@ -161,7 +176,7 @@ class PricingCategory:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CancellationPolicy:
     """Cancellation policy reference."""
     id: int
@@ -171,7 +186,78 @@ class CancellationPolicy:
         return {"id": self.id, "title": self.title}
 
 
-@dataclass
+def _build_start_point(sp: Dict[str, Any]) -> StartPoint:
+    get = sp.get
+    addr_data = get("address", {})
+    addr_get = addr_data.get
+    # Only build a GeoPoint when both coordinates are present
+    geo = addr_get("geoPoint")
+    geo_point = None
+    if geo:
+        latitude = geo.get("latitude")
+        longitude = geo.get("longitude")
+        if latitude is not None and longitude is not None:
+            geo_point = GeoPoint(latitude, longitude)
+    address = Address(
+        address_line1=addr_get("addressLine1", ""),
+        address_line2=addr_get("addressLine2", ""),
+        city=addr_get("city", ""),
+        state=addr_get("state", ""),
+        postal_code=addr_get("postalCode", ""),
+        country_code=addr_get("countryCode", "FI"),
+        geo_point=geo_point,
+    )
+    return StartPoint(
+        id=get("id"),
+        title=get("title", ""),
+        address=address,
+    )
+
+
+def _build_start_time(st: Dict[str, Any]) -> StartTime:
+    get = st.get
+    return StartTime(
+        id=get("id"),
+        hour=get("hour", 0),
+        minute=get("minute", 0),
+        duration_hours=get("durationHours", 0),
+        duration_minutes=get("durationMinutes", 0),
+        label=get("label"),
+    )
+
+
+def _build_pricing_category(pc: Dict[str, Any]) -> PricingCategory:
+    get = pc.get
+    return PricingCategory(
+        id=get("id"),
+        title=get("title", ""),
+        ticket_category=get("ticketCategory", "ADULT"),
+        min_per_booking=get("minPerBooking", 1),
+        max_per_booking=get("maxPerBooking", 0),
+    )
+
+
+def _build_location_code(lc: Dict[str, Any]) -> LocationCode:
+    get = lc.get
+    return LocationCode(
+        country=get("country", "FI"),
+        location=get("location", ""),
+        name=get("name", ""),
+    )
+
+
+def _build_google_place(gp: Dict[str, Any]) -> GooglePlace:
+    get = gp.get
+    return GooglePlace(
+        country=get("country", ""),
+        country_code=get("countryCode", "FI"),
+        city=get("city", ""),
+        name=get("name", ""),
+        geo_location_center=get("geoLocationCenter"),
+    )
+
+
+@dataclass(slots=True)
 class Experience:
     """Bokun experience/product."""
     title: str
@@ -182,8 +268,9 @@ class Experience:
     capacity_type: CapacityType = CapacityType.ON_REQUEST
     id: Optional[int] = None
     excerpt: str = ""
-    flags: List[str] = field(default_factory=list)
-    keywords: List[str] = field(default_factory=list)
+    # Default to a shared empty tuple; assign a new sequence rather than mutating
+    flags: Sequence[str] = _EMPTY
+    keywords: Sequence[str] = _EMPTY
     start_points: List[StartPoint] = field(default_factory=list)
     start_times: List[StartTime] = field(default_factory=list)
     pricing_categories: List[PricingCategory] = field(default_factory=list)
@@ -191,92 +278,57 @@ class Experience:
     google_place: Optional[GooglePlace] = None
     cancellation_policy_id: Optional[int] = None
     published: bool = False
-    base_language: str = "en_GB"
-    time_zone: str = "Europe/Helsinki"
+    base_language: str = _DEFAULT_LANG
+    time_zone: str = _DEFAULT_TZ
 
     @classmethod
     def from_api_response(cls, data: Dict[str, Any]) -> "Experience":
         """Create Experience from Bokun API response."""
-        start_points = []
-        for sp in data.get("startPoints", []):
-            addr_data = sp.get("address", {})
-            geo = addr_data.get("geoPoint")
-            address = Address(
-                address_line1=addr_data.get("addressLine1", ""),
-                address_line2=addr_data.get("addressLine2", ""),
-                city=addr_data.get("city", ""),
-                state=addr_data.get("state", ""),
-                postal_code=addr_data.get("postalCode", ""),
-                country_code=addr_data.get("countryCode", "FI"),
-                geo_point=GeoPoint(geo["latitude"], geo["longitude"]) if geo else None,
-            )
-            start_points.append(StartPoint(
-                id=sp.get("id"),
-                title=sp.get("title", ""),
-                address=address,
-            ))
-
-        start_times = []
-        for st in data.get("startTimes", []):
-            start_times.append(StartTime(
-                id=st.get("id"),
-                hour=st.get("hour", 0),
-                minute=st.get("minute", 0),
-                duration_hours=st.get("durationHours", 0),
-                duration_minutes=st.get("durationMinutes", 0),
-                label=st.get("label"),
-            ))
-
-        pricing_categories = []
-        for pc in data.get("pricingCategories", []):
-            pricing_categories.append(PricingCategory(
-                id=pc.get("id"),
-                title=pc.get("title", ""),
-                ticket_category=pc.get("ticketCategory", "ADULT"),
-                min_per_booking=pc.get("minPerBooking", 1),
-                max_per_booking=pc.get("maxPerBooking", 0),
-            ))
-
-        loc_code = data.get("locationCode")
-        location_code = LocationCode(
-            country=loc_code.get("country", "FI"),
-            location=loc_code.get("location", ""),
-            name=loc_code.get("name", ""),
-        ) if loc_code else None
-
-        gp = data.get("googlePlace")
-        google_place = GooglePlace(
-            country=gp.get("country", ""),
-            country_code=gp.get("countryCode", "FI"),
-            city=gp.get("city", ""),
-            name=gp.get("name", ""),
-            geo_location_center=gp.get("geoLocationCenter"),
-        ) if gp else None
-
-        cancel_policy = data.get("cancellationPolicy")
+        get = data.get
+        start_points = [_build_start_point(sp) for sp in get("startPoints", ())]
+        start_times = [_build_start_time(st) for st in get("startTimes", ())]
+        pricing_categories = [
+            _build_pricing_category(pc) for pc in get("pricingCategories", ())
+        ]
+
+        loc_code = get("locationCode")
+        location_code = _build_location_code(loc_code) if loc_code else None
+
+        gp = get("googlePlace")
+        google_place = _build_google_place(gp) if gp else None
+
+        cancel_policy = get("cancellationPolicy")
+        difficulty = get("difficultyLevel", "EASY")
+        capacity = get("capacityType", "ON_REQUEST")
 
         return cls(
-            id=data.get("id"),
-            title=data.get("title", ""),
-            description=data.get("description", ""),
-            excerpt=data.get("excerpt", ""),
-            duration_hours=data.get("durationHours", 0),
-            duration_minutes=data.get("durationMinutes", 0),
-            difficulty_level=DifficultyLevel(data.get("difficultyLevel", "EASY")),
-            capacity_type=CapacityType(data.get("capacityType", "ON_REQUEST")),
-            flags=data.get("flags", []),
-            keywords=data.get("keywords", []),
+            id=get("id"),
+            title=get("title", ""),
+            description=get("description", ""),
+            excerpt=get("excerpt", ""),
+            duration_hours=get("durationHours", 0),
+            duration_minutes=get("durationMinutes", 0),
+            difficulty_level=_DIFFICULTY_MAP.get(difficulty) or DifficultyLevel(difficulty),
+            capacity_type=_CAPACITY_MAP.get(capacity) or CapacityType(capacity),
+            flags=get("flags", _EMPTY),
+            keywords=get("keywords", _EMPTY),
             start_points=start_points,
             start_times=start_times,
             pricing_categories=pricing_categories,
             location_code=location_code,
             google_place=google_place,
             cancellation_policy_id=cancel_policy.get("id") if cancel_policy else None,
-            published=data.get("published", False),
-            base_language=data.get("baseLanguage", "en_GB"),
-            time_zone=data.get("timeZone", "Europe/Helsinki"),
+            published=get("published", False),
+            base_language=get("baseLanguage", _DEFAULT_LANG),
+            time_zone=get("timeZone", _DEFAULT_TZ),
         )
 
+    @classmethod
+    def from_api_responses(cls, items: Iterable[Dict[str, Any]]) -> List["Experience"]:
+        """Create Experiences from a list of API response items (e.g. search results)."""
+        build = cls.from_api_response
+        return [build(item) for item in items]
+
     def to_create_payload(self) -> Dict[str, Any]:
         """Convert to API create payload."""
         payload = {
@@ -294,19 +346,19 @@ class Experience:
             "meetingType": "MEET_ON_LOCATION",
             "baseLanguage": self.base_language,
             "timeZone": self.time_zone,
-            "flags": self.flags,
-            "keywords": self.keywords,
+            "flags": list(self.flags),
+            "keywords": list(self.keywords),
             "published": self.published,
         }
 
         if self.start_points:
-            payload["startPoints"] = [sp.to_dict() for sp in self.start_points]
+            payload["startPoints"] = list(map(StartPoint.to_dict, self.start_points))
 
         if self.start_times:
-            payload["startTimes"] = [st.to_dict() for st in self.start_times]
+            payload["startTimes"] = list(map(StartTime.to_dict, self.start_times))
 
         if self.pricing_categories:
-            payload["pricingCategories"] = [pc.to_dict() for pc in self.pricing_categories]
+            payload["pricingCategories"] = list(map(PricingCategory.to_dict, self.pricing_categories))
 
         if self.location_code:
             payload["locationCode"] = self.location_code.to_dict()
@@ -320,7 +372,7 @@ class Experience:
         return payload
 
 
-@dataclass
+@dataclass(slots=True)
 class Booking:
     """Bokun booking."""
     confirmation_code: str
@@ -330,24 +382,49 @@ class Booking:
     customer_email: str = ""
     start_date: Optional[str] = None
     product_title: str = ""
-    total_amount: Decimal = Decimal("0")
+    total_amount: Decimal = _ZERO
     currency: str = "EUR"
 
     @classmethod
     def from_api_response(cls, data: Dict[str, Any]) -> "Booking":
         """Create Booking from API response."""
-        customer = data.get("customer", {})
-        total_price = data.get("totalPrice", {})
-        product_bookings = data.get("productBookings", [])
+        get = data.get
+        customer = get("customer", {})
+        total_price = get("totalPrice", {})
+        product_bookings = get("productBookings", [])
+        status = get("status", "PENDING")
+
+        # Join names only when both are present (same result as f"{fn} {ln}".strip())
+        customer_get = customer.get
+        first_name = customer_get("firstName", "")
+        last_name = customer_get("lastName", "")
+        if not last_name:
+            customer_name = first_name.strip()
+        elif not first_name:
+            customer_name = last_name.strip()
+        else:
+            customer_name = f"{first_name} {last_name}".strip()
+
+        # Zero totals are common (comps, pending); share one immutable Decimal.
+        # Ints and Decimals convert exactly; only floats/strings go through str().
+        amount = total_price.get("amount")
+        if amount in _ZERO_AMOUNTS:
+            total_amount = _ZERO
+        elif type(amount) is Decimal:
+            total_amount = amount
+        elif type(amount) is int:
+            total_amount = Decimal(amount)
+        else:
+            total_amount = Decimal(str(amount))
 
         return cls(
-            id=data.get("id"),
-            confirmation_code=data.get("confirmationCode", ""),
-            status=BookingStatus(data.get("status", "PENDING")),
-            customer_name=f"{customer.get('firstName', '')} {customer.get('lastName', '')}".strip(),
-            customer_email=customer.get("email", ""),
-            start_date=data.get("startDate"),
+            id=get("id"),
+            confirmation_code=get("confirmationCode", ""),
+            status=_STATUS_MAP.get(status) or BookingStatus(status),
+            customer_name=customer_name,
+            customer_email=customer_get("email", ""),
+            start_date=get("startDate"),
             product_title=product_bookings[0].get("productTitle", "") if product_bookings else "",
-            total_amount=Decimal(str(total_price.get("amount", 0))),
+            total_amount=total_amount,
             currency=total_price.get("currency", "EUR"),
         )
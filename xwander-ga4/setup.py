@@ -29,6 +29,9 @@ setup(
         "click>=8.0.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.9.0",
+        ],
         "dev": [
             "pytest>=7.0",
             "pytest-cov>=3.0",
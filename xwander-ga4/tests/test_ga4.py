@@ -1,9 +1,14 @@
 """Tests for GA4 plugin"""
 
+import asyncio
+import json
+import tempfile
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from datetime import datetime, timedelta
 
+from google.analytics.data_v1beta.types import PropertyQuota, QuotaStatus
+
 from xwander_ga4 import (
     GA4DataClient,
     GA4AdminClient,
@@ -14,6 +19,8 @@ from xwander_ga4 import (
     GA4ValidationError,
     GA4ConfigError,
 )
+from xwander_ga4.cache import ReportCache
+from xwander_ga4.client import _admin_api_client, _data_api_client, get_data_client
 
 
 class TestGA4DataClient(unittest.TestCase):
@@ -21,6 +28,8 @@ class TestGA4DataClient(unittest.TestCase):
 
     def setUp(self):
         self.property_id = "358203796"
+        _data_api_client.cache_clear()
+        get_data_client.cache_clear()
 
     @patch("xwander_ga4.client.BetaAnalyticsDataClient")
     def test_init_success(self, mock_client):
@@ -29,6 +38,14 @@ class TestGA4DataClient(unittest.TestCase):
         assert client.property_id == self.property_id
         assert client.property_resource == f"properties/{self.property_id}"
 
+    @patch("xwander_ga4.client.BetaAnalyticsDataClient")
+    def test_init_reuses_api_client(self, mock_client):
+        """Test clients with the same credentials share one API client"""
+        first = GA4DataClient(self.property_id)
+        second = GA4DataClient("123")
+        assert first.client is second.client
+        mock_client.assert_called_once()
+
     @patch("xwander_ga4.client.BetaAnalyticsDataClient")
     def test_init_failure(self, mock_client):
         """Test failed client initialization"""
@@ -52,16 +69,10 @@ class TestGA4DataClient(unittest.TestCase):
         mock_response.row_count = 0
         mock_response.dimension_headers = []
         mock_response.metric_headers = []
-        mock_response.property_quota = MagicMock(
-            tokens_per_day=1000,
-            tokens_per_hour=100,
-            concurrent_requests=10,
-            server_errors_per_day=5,
-            tokens_used=50,
-            tokens_remaining=950,
-            reset_window_reset_delay_days=1,
-            concurrent_requests_used=1,
-            concurrent_requests_remaining=9,
+        mock_response.property_quota = PropertyQuota(
+            tokens_per_day=QuotaStatus(consumed=50, remaining=950),
+            tokens_per_hour=QuotaStatus(consumed=50, remaining=50),
+            concurrent_requests=QuotaStatus(remaining=9),
         )
 
         client = GA4DataClient(self.property_id)
@@ -74,9 +85,33 @@ class TestGA4DataClient(unittest.TestCase):
         )
 
         assert "rows" in result
-        assert "property_quota" in result
+        assert result["property_quota"]["tokens_per_day"] == {"consumed": 50, "remaining": 950}
         assert result["row_count"] == 0
 
+    def test_format_rows(self):
+        """Test rows are keyed by dimension and metric header names"""
+        response = MagicMock()
+        response.dimension_headers = [Mock(), Mock()]
+        response.dimension_headers[0].name = "source"
+        response.dimension_headers[1].name = "medium"
+        response.metric_headers = [Mock()]
+        response.metric_headers[0].name = "sessions"
+        response.rows = [
+            Mock(
+                dimension_values=[Mock(value="google"), Mock(value="organic")],
+                metric_values=[Mock(value="42")],
+            )
+        ]
+        rows = GA4DataClient._format_rows(response)
+        assert rows == [{"source": "google", "medium": "organic", "sessions": "42"}]
+
+    @patch("xwander_ga4.client.BetaAnalyticsDataClient")
+    def test_get_data_client_shared(self, mock_client):
+        """Test get_data_client returns one client per property"""
+        client = get_data_client(self.property_id)
+        assert get_data_client(self.property_id) is client
+        assert get_data_client("999") is not client
+
     @patch("xwander_ga4.client.BetaAnalyticsDataClient")
     def test_run_realtime_report(self, mock_client):
         """Test realtime report"""
@@ -97,12 +132,124 @@ class TestGA4DataClient(unittest.TestCase):
         assert "rows" in result
         assert "total_users" in result
 
+    @patch("xwander_ga4.client.BetaAnalyticsDataClient")
+    def test_run_report_uses_cache(self, mock_client):
+        """Test repeated reports are served from the cache"""
+        mock_response = MagicMock()
+        mock_response.rows = []
+        mock_response.row_count = 0
+        mock_response.dimension_headers = []
+        mock_response.metric_headers = []
+        mock_response.property_quota = PropertyQuota(
+            tokens_per_day=QuotaStatus(consumed=5, remaining=995)
+        )
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = GA4DataClient(self.property_id, cache=ReportCache(cache_dir))
+            api_call = MagicMock(return_value=mock_response)
+            client.client.run_report = api_call
+            kwargs = dict(
+                date_ranges=[{"start_date": "2026-01-01", "end_date": "2026-01-07"}],
+                dimensions=["date"],
+                metrics=["sessions"],
+            )
+            first = client.run_report(**kwargs)
+            second = client.run_report(**kwargs)
+
+            # Memory hits are fresh copies; editing one leaves the cache intact
+            second["rows"].append({"date": "20260101"})
+            second = client.run_report(**kwargs)
+
+            # A fresh cache instance reads the on-disk copy
+            disk_client = GA4DataClient(self.property_id, cache=ReportCache(cache_dir))
+            third = disk_client.run_report(**kwargs)
+
+        assert first == second == third
+        api_call.assert_called_once()
+
+    def test_report_cache_hits_are_independent(self):
+        """Test editing a returned report does not change the next get"""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = ReportCache(cache_dir)
+            cache.set("key", {"rows": [{"date": "20260101"}]})
+            cache.get("key", 60)["rows"].clear()
+            assert cache.get("key", 60) == {"rows": [{"date": "20260101"}]}
+
+    @patch("xwander_ga4.client.BetaAnalyticsDataClient")
+    def test_batch_run_reports_limit(self, mock_client):
+        """Test batch_run_reports rejects more than 5 reports"""
+        client = GA4DataClient(self.property_id)
+        report = {
+            "date_ranges": [{"start_date": "2026-01-01", "end_date": "2026-01-07"}],
+            "dimensions": ["date"],
+            "metrics": ["sessions"],
+        }
+        with self.assertRaises(GA4ValidationError):
+            client.batch_run_reports([report] * 6)
+
+    @patch("xwander_ga4.client.BetaAnalyticsDataAsyncClient")
+    @patch("xwander_ga4.client.BetaAnalyticsDataClient")
+    def test_run_reports_async(self, mock_client, mock_async_client):
+        """Test concurrent reports go through the async client"""
+        mock_response = MagicMock()
+        mock_response.rows = []
+        mock_response.row_count = 0
+        mock_response.dimension_headers = []
+        mock_response.metric_headers = []
+        mock_response.property_quota = PropertyQuota()
+        mock_async_client.return_value.run_report = AsyncMock(return_value=mock_response)
+
+        client = GA4DataClient(self.property_id)
+        report = {
+            "date_ranges": [{"start_date": "2026-01-01", "end_date": "2026-01-07"}],
+            "dimensions": ["date"],
+            "metrics": ["sessions"],
+        }
+        results = asyncio.run(client.run_reports_async([report, report, report]))
+
+        assert len(results) == 3
+        assert mock_async_client.return_value.run_report.await_count == 3
+        client.client.run_report.assert_not_called()
+
+    @patch("xwander_ga4.client.BetaAnalyticsDataAsyncClient")
+    @patch("xwander_ga4.client.BetaAnalyticsDataClient")
+    def test_run_reports_async_across_event_loops(self, mock_client, mock_async_client):
+        """Test each asyncio.run gets an async client bound to its own loop"""
+        mock_response = MagicMock()
+        mock_response.rows = []
+        mock_response.row_count = 0
+        mock_response.dimension_headers = []
+        mock_response.metric_headers = []
+        mock_response.property_quota = PropertyQuota()
+        loops = []
+
+        async def run_report(request):
+            loops.append(asyncio.get_running_loop())
+            return mock_response
+
+        mock_async_client.side_effect = lambda: MagicMock(run_report=run_report)
+
+        client = GA4DataClient(self.property_id)
+        report = {
+            "date_ranges": [{"start_date": "2026-01-01", "end_date": "2026-01-07"}],
+            "dimensions": ["date"],
+            "metrics": ["sessions"],
+        }
+        asyncio.run(client.run_reports_async([report, report]))
+        asyncio.run(client.run_reports_async([report, report]))
+
+        assert len(loops) == 4
+        assert loops[0] is loops[1] and loops[2] is loops[3]
+        assert loops[0] is not loops[2]
+        assert mock_async_client.call_count == 2
+
 
 class TestGA4AdminClient(unittest.TestCase):
     """Test GA4 Admin API client"""
 
     def setUp(self):
         self.property_id = "358203796"
+        _admin_api_client.cache_clear()
 
     @patch("xwander_ga4.client.AnalyticsAdminServiceClient")
     def test_init_success(self, mock_client):
@@ -122,12 +269,46 @@ class TestGA4AdminClient(unittest.TestCase):
                 scope="INVALID",
             )
 
+    @patch("xwander_ga4.client.AnalyticsAdminServiceClient")
+    def test_list_custom_dimensions_pages(self, mock_client):
+        """Test dimensions are collected across every page"""
+        def page(*names):
+            dims = []
+            for name in names:
+                dim = MagicMock(api_name=f"customEvent:{name}", parameter_name=name)
+                dim.scope.name = "EVENT"
+                dims.append(dim)
+            return Mock(custom_dimensions=dims)
+
+        client = GA4AdminClient(self.property_id)
+        client.client.list_custom_dimensions.return_value = Mock(
+            pages=iter([page("a", "b"), page("c")])
+        )
+        dimensions = client.list_custom_dimensions()
+        assert [d["parameter_name"] for d in dimensions] == ["a", "b", "c"]
+
+    @patch("xwander_ga4.client.AnalyticsAdminServiceClient")
+    def test_create_dimension_invalid_name(self, mock_client):
+        """Test invalid names are rejected before any API call"""
+        client = GA4AdminClient(self.property_id)
+        with self.assertRaises(GA4ValidationError):
+            client.create_custom_dimension(display_name="Test", parameter_name="1bad")
+        with self.assertRaises(GA4ValidationError):
+            client.create_custom_dimension(display_name="", parameter_name="ok")
+        client.client.create_custom_dimension.assert_not_called()
+
 
 class TestReportBuilder(unittest.TestCase):
     """Test report builder"""
 
+    @classmethod
+    def setUpClass(cls):
+        # Building a spec'd mock introspects the whole class; do it once
+        cls._mock_client = MagicMock(spec=GA4DataClient)
+
     def setUp(self):
-        self.mock_client = MagicMock(spec=GA4DataClient)
+        self.mock_client = self._mock_client
+        self.mock_client.reset_mock(return_value=True, side_effect=True)
 
     def test_last_n_days_invalid_days(self):
         """Test last_n_days with invalid days"""
@@ -140,9 +321,9 @@ class TestReportBuilder(unittest.TestCase):
 
     def test_last_n_days_success(self):
         """Test successful last_n_days report"""
-        self.mock_client.run_report = MagicMock(
-            return_value={"rows": [], "row_count": 0, "property_quota": {}}
-        )
+        self.mock_client.run_report.return_value = {
+            "rows": [], "row_count": 0, "property_quota": {}
+        }
         builder = ReportBuilder(self.mock_client)
         result = builder.last_n_days(days=7, dimensions=["date"], metrics=["sessions"])
         assert result is not None
@@ -150,14 +331,45 @@ class TestReportBuilder(unittest.TestCase):
 
     def test_traffic_sources(self):
         """Test traffic_sources report"""
-        self.mock_client.run_report = MagicMock(
-            return_value={"rows": [], "row_count": 0, "property_quota": {}}
-        )
+        self.mock_client.run_report.return_value = {
+            "rows": [], "row_count": 0, "property_quota": {}
+        }
         builder = ReportBuilder(self.mock_client)
         result = builder.traffic_sources(days=30)
         assert result is not None
         self.mock_client.run_report.assert_called_once()
 
+    def test_dashboard(self):
+        """Test dashboard runs the standard reports as one batch"""
+        empty = {"rows": [], "row_count": 0, "property_quota": {}}
+        self.mock_client.batch_run_reports.return_value = [empty] * 4
+        builder = ReportBuilder(self.mock_client)
+        result = builder.dashboard(days=7)
+        assert list(result) == ["traffic_sources", "top_pages", "conversions", "daily_summary"]
+        self.mock_client.batch_run_reports.assert_called_once()
+        self.mock_client.run_report.assert_not_called()
+
+    def test_dashboard_parallel(self):
+        """Test dashboard_parallel runs each standard report once"""
+        self.mock_client.run_report.return_value = {
+            "rows": [], "row_count": 0, "property_quota": {}
+        }
+        builder = ReportBuilder(self.mock_client)
+        result = builder.dashboard_parallel(days=7)
+        assert list(result) == ["traffic_sources", "top_pages", "conversions", "daily_summary"]
+        assert self.mock_client.run_report.call_count == 4
+
+    def test_run_batch_chunks(self):
+        """Test run_batch splits specs into batches of at most 5, keeping order"""
+        self.mock_client.batch_run_reports.side_effect = (
+            lambda specs: [{"rows": [], "row_count": s["limit"]} for s in specs]
+        )
+        builder = ReportBuilder(self.mock_client)
+        specs = [{"limit": i} for i in range(7)]
+        result = builder.run_batch(specs)
+        assert [r["row_count"] for r in result] == list(range(7))
+        assert self.mock_client.batch_run_reports.call_count == 2
+
 
 class TestReportFormatter(unittest.TestCase):
     """Test report formatter"""
@@ -176,6 +388,13 @@ class TestReportFormatter(unittest.TestCase):
         assert "sessions" in result
         assert "2026-01-01" in result
 
+    def test_json_iter(self):
+        """Test streamed JSON chunks join to the same document"""
+        data = {"rows": [{"date": "2026-01-01", "sessions": "100"}], "row_count": 1}
+        chunks = list(ReportFormatter.json_iter(data))
+        assert len(chunks) > 1
+        assert json.loads("".join(chunks)) == data
+
     def test_table_empty_data(self):
         """Test table formatting with empty data"""
         data = {"rows": []}
@@ -190,6 +409,14 @@ class TestReportFormatter(unittest.TestCase):
         result = formatter.json(data)
         assert "2026-01-01" in result
 
+    def test_json_non_ascii(self):
+        """Test non-ASCII dimension values are written as-is, not escaped"""
+        data = {"rows": [{"city": "Äkäslompolo", "sessions": "12"}]}
+        result = ReportFormatter.json(data)
+        assert "Äkäslompolo" in result
+        assert json.loads(result) == data
+        assert "".join(ReportFormatter.json_iter(data)) == result
+
     def test_summary_format(self):
         """Test summary formatting"""
         data = {
@@ -203,12 +430,28 @@ class TestReportFormatter(unittest.TestCase):
         assert "Rows:" in result
         assert "date" in result
 
+        data["property_quota"] = {"tokens_per_day": {"consumed": 50, "remaining": 950}}
+        assert "Quota: 50 / 1000 tokens today" in formatter.summary(data)
+
+    def test_summary_lazy_rows(self):
+        """Test summary reads only the head of an iterator of rows"""
+        rows = iter([{"date": f"2026-01-{i:02d}"} for i in range(1, 21)])
+        result = ReportFormatter.summary({"rows": rows})
+        assert "Rows: 5+" in result
+        assert "... and more rows" in result
+        assert len(list(rows)) == 14
+
 
 class TestDimensionManager(unittest.TestCase):
     """Test dimension manager"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls._mock_admin = MagicMock(spec=GA4AdminClient)
+
     def setUp(self):
-        self.mock_admin = MagicMock(spec=GA4AdminClient)
+        self.mock_admin = self._mock_admin
+        self.mock_admin.reset_mock(return_value=True, side_effect=True)
 
     def test_validate_parameter_name(self):
         """Test parameter name validation"""
@@ -241,15 +484,81 @@ class TestDimensionManager(unittest.TestCase):
 
     def test_create_dimension(self):
         """Test dimension creation"""
-        self.mock_admin.create_custom_dimension = MagicMock(
-            return_value={"api_name": "customEvent:test"}
-        )
+        self.mock_admin.create_custom_dimension.return_value = {
+            "api_name": "customEvent:test"
+        }
         manager = DimensionManager(self.mock_admin)
         result = manager.create(
             display_name="Test", parameter_name="test", scope="EVENT"
         )
         assert result["api_name"] == "customEvent:test"
 
+    def test_queries_share_one_listing(self):
+        """Test by_scope and get_by_name reuse one list call until create()"""
+        self.mock_admin.iter_custom_dimensions.side_effect = lambda: iter([
+            {"parameter_name": "a", "scope": "EVENT"},
+            {"parameter_name": "b", "scope": "USER"},
+        ])
+        self.mock_admin.create_custom_dimension.return_value = {}
+        manager = DimensionManager(self.mock_admin)
+        assert [d["parameter_name"] for d in manager.by_scope("EVENT")] == ["a"]
+        assert manager.get_by_name("b")["scope"] == "USER"
+        assert manager.get_by_name("missing") is None
+        assert self.mock_admin.iter_custom_dimensions.call_count == 1
+
+        manager.create(display_name="C", parameter_name="c")
+        manager.by_scope("EVENT")
+        assert self.mock_admin.iter_custom_dimensions.call_count == 2
+
+    def test_stream_caches_once_consumed(self):
+        """Test stream() yields lazily and fills the cache when exhausted"""
+        self.mock_admin.iter_custom_dimensions.return_value = iter(
+            [{"parameter_name": "a", "scope": "EVENT"}]
+        )
+        manager = DimensionManager(self.mock_admin)
+        stream = manager.stream()
+        self.mock_admin.iter_custom_dimensions.assert_not_called()
+        assert next(stream)["parameter_name"] == "a"
+        assert manager._cache is None
+        assert list(stream) == []
+        assert manager.get_by_name("a")["scope"] == "EVENT"
+        assert self.mock_admin.iter_custom_dimensions.call_count == 1
+
+
+class TestAudienceManager(unittest.TestCase):
+    """Test audience manager"""
+
+    def setUp(self):
+        self.mock_admin = MagicMock(spec=GA4AdminClient)
+        self.mock_admin.list_audiences = MagicMock(
+            return_value=[
+                {"name": "Buyers", "member_count": 10},
+                {"name": "Visitors", "member_count": 500},
+            ]
+        )
+
+    def test_queries_reuse_cached_list(self):
+        """Test chained queries share one list_audiences call"""
+        manager = AudienceManager(self.mock_admin)
+        assert manager.get_by_name("Buyers")["member_count"] == 10
+        assert len(manager.filter_by_name("vis")) == 1
+        assert manager.sorted_by_size()[0]["name"] == "Visitors"
+        assert self.mock_admin.list_audiences.call_count == 1
+
+    def test_get_by_name_first_match(self):
+        """Test name lookups return the first audience with that name"""
+        self.mock_admin.list_audiences.return_value.append({"name": "Buyers", "member_count": 1})
+        manager = AudienceManager(self.mock_admin)
+        assert manager.get_by_name("Buyers")["member_count"] == 10
+        assert manager.get_by_name("Missing") is None
+
+    def test_list_always_refetches(self):
+        """Test list() bypasses the cache"""
+        manager = AudienceManager(self.mock_admin)
+        manager.list()
+        manager.list()
+        assert self.mock_admin.list_audiences.call_count == 2
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,22 +1,32 @@
 """Xwander GA4 Plugin - Google Analytics 4 API wrapper"""
 
+import importlib
+
 __version__ = "1.1.0"
 
-from .client import GA4DataClient, GA4AdminClient
-from .reports import ReportBuilder, ReportFormatter
-from .dimensions import DimensionManager
-from .audiences import AudienceManager
-from .exceptions import (
-    GA4Error,
-    GA4ConfigError,
-    GA4APIError,
-    GA4ValidationError,
-    GA4AuthError,
-)
+# Exports are resolved on first access (PEP 562) so the CLI and the formatters
+# do not import the Google client libraries until a client is needed.
+_EXPORTS = {
+    "GA4DataClient": ".client",
+    "GA4AdminClient": ".client",
+    "get_data_client": ".client",
+    "ReportCache": ".cache",
+    "ReportBuilder": ".reports",
+    "ReportFormatter": ".reports",
+    "DimensionManager": ".dimensions",
+    "AudienceManager": ".audiences",
+    "GA4Error": ".exceptions",
+    "GA4ConfigError": ".exceptions",
+    "GA4APIError": ".exceptions",
+    "GA4ValidationError": ".exceptions",
+    "GA4AuthError": ".exceptions",
+}
 
 __all__ = [
     "GA4DataClient",
     "GA4AdminClient",
+    "get_data_client",
+    "ReportCache",
     "ReportBuilder",
     "ReportFormatter",
     "DimensionManager",
@@ -27,3 +37,16 @@ __all__ = [
     "GA4ValidationError",
     "GA4AuthError",
 ]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
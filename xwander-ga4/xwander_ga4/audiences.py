@@ -1,39 +1,63 @@
 """GA4 Audience management"""
 
-from typing import Any, Dict, List
-from .client import GA4AdminClient
+import time
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import GA4AdminClient
 
 
 class AudienceManager:
     """Manage GA4 audiences"""
 
-    def __init__(self, admin_client: GA4AdminClient):
+    def __init__(self, admin_client: "GA4AdminClient", cache_ttl: float = 5.0):
         """
         Initialize AudienceManager
 
         Args:
             admin_client: GA4AdminClient instance for API access
+            cache_ttl: Seconds the query helpers reuse a fetched audience list
         """
         self.admin = admin_client
+        self.cache_ttl = cache_ttl
+        self._cache: Optional[List[Dict[str, Any]]] = None
+        self._cache_ts = 0.0
+        self._by_name: Optional[Dict[str, Dict[str, Any]]] = None
 
     def list(self) -> List[Dict[str, Any]]:
-        """List all audiences"""
-        return self.admin.list_audiences()
+        """List all audiences (always hits the API and refreshes the cache)"""
+        audiences = self.admin.list_audiences()
+        self._cache = audiences
+        self._cache_ts = time.monotonic()
+        self._by_name = None
+        return audiences
+
+    def _fetch(self) -> List[Dict[str, Any]]:
+        """Return the cached audience list, refetching once it is older than cache_ttl"""
+        if self._cache is None or time.monotonic() - self._cache_ts >= self.cache_ttl:
+            return self.list()
+        return self._cache
+
+    def _by_name_index(self) -> Dict[str, Dict[str, Any]]:
+        """Return a name -> audience index over the cached list (first match wins)"""
+        audiences = self._fetch()
+        if self._by_name is None:
+            index: Dict[str, Dict[str, Any]] = {}
+            for audience in audiences:
+                index.setdefault(audience["name"], audience)
+            self._by_name = index
+        return self._by_name
 
     def filter_by_name(self, name_pattern: str) -> List[Dict[str, Any]]:
         """Filter audiences by name pattern"""
-        audiences = self.list()
-        return [a for a in audiences if name_pattern.lower() in a["name"].lower()]
+        needle = name_pattern.lower()
+        return [a for a in self._fetch() if needle in a["name"].lower()]
 
     def get_by_name(self, name: str) -> Dict[str, Any]:
         """Get audience by exact name"""
-        audiences = self.list()
-        for audience in audiences:
-            if audience["name"] == name:
-                return audience
-        return None
+        return self._by_name_index().get(name)
 
     def sorted_by_size(self) -> List[Dict[str, Any]]:
         """List audiences sorted by member count (largest first)"""
-        audiences = self.list()
+        audiences = self._fetch()
         return sorted(audiences, key=lambda a: a.get("member_count", 0), reverse=True)
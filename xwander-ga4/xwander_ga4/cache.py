@@ -0,0 +1,86 @@
+"""TTL cache for GA4 report responses"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "xwander-ga4"
+REPORT_TTL = 300.0
+REALTIME_TTL = 30.0
+
+
+class ReportCache:
+    """
+    In-memory + on-disk cache for formatted report responses
+
+    Entries are keyed on the full request (property, dimensions, metrics, ranges,
+    paging, ordering) and expire by age. The on-disk copy lets repeated CLI runs
+    skip the API round-trip; disk errors are ignored and treated as misses.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        ttl: float = REPORT_TTL,
+        realtime_ttl: float = REALTIME_TTL,
+    ):
+        """
+        Initialize ReportCache
+
+        Args:
+            directory: Cache directory (default: ~/.cache/xwander-ga4)
+            ttl: Seconds a report response stays fresh
+            realtime_ttl: Seconds a realtime response stays fresh
+        """
+        self.directory = Path(directory) if directory else DEFAULT_CACHE_DIR
+        self.ttl = ttl
+        self.realtime_ttl = realtime_ttl
+        # key -> (stored at, JSON text); decoded on every hit so callers get a
+        # fresh object, the same as a disk hit
+        self._memory: Dict[str, Tuple[float, str]] = {}
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a stable cache key from request parameters"""
+        raw = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, ttl: float) -> Optional[Dict[str, Any]]:
+        """Return a cached response younger than ttl seconds, or None"""
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None:
+            if now - entry[0] < ttl:
+                return json.loads(entry[1])
+            del self._memory[key]
+
+        path = self.directory / f"{key}.json"
+        try:
+            mtime = path.stat().st_mtime
+            if now - mtime >= ttl:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                encoded = f.read()
+            value = json.loads(encoded)
+        except (OSError, ValueError):
+            return None
+
+        self._memory[key] = (mtime, encoded)
+        return value
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a response in memory and on disk"""
+        encoded = json.dumps(value, default=str)
+        self._memory[key] = (time.time(), encoded)
+        path = self.directory / f"{key}.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(encoded)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
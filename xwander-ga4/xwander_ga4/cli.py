@@ -1,27 +1,112 @@
 """GA4 CLI - Command line interface for GA4 operations"""
 
-import json
+import functools
 import sys
-from typing import List, Optional
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import click
 
-from .client import GA4DataClient, GA4AdminClient
 from .reports import ReportBuilder, ReportFormatter
 from .dimensions import DimensionManager
 from .audiences import AudienceManager
 from .exceptions import GA4Error
 
+if TYPE_CHECKING:
+    from .cache import ReportCache
+    from .client import GA4AdminClient, GA4DataClient
+
 
 # Default property ID for Xwander
 DEFAULT_PROPERTY_ID = "358203796"
 
 
-@click.group()
-def cli():
+# Shared option decorators and choice types, built once at import and reused
+# by every command that takes them.
+_property_id_option = click.option(
+    "--property-id",
+    default=DEFAULT_PROPERTY_ID,
+    help="GA4 property ID (default: Xwander)",
+)
+_days_option = click.option("--days", type=int, default=30, help="Number of days")
+_no_cache_option = click.option(
+    "--no-cache", is_flag=True, help="Bypass the local response cache"
+)
+_ndjson_option = click.option(
+    "--json", "as_json", is_flag=True, help="Output one JSON object per line"
+)
+_SCOPE_CHOICE = click.Choice(["EVENT", "USER", "ITEM"])
+_property_ids_option = click.option(
+    "--property-id",
+    "property_ids",
+    multiple=True,
+    default=(DEFAULT_PROPERTY_ID,),
+    help="GA4 property ID; repeat or comma-separate for several (default: Xwander)",
+)
+
+# Properties queried at once; GA4 allows 10 concurrent requests
+MAX_PARALLEL_PROPERTIES = 10
+
+
+# The Google client libraries (gRPC, protobuf) take hundreds of ms to import,
+# so they are only loaded once a command actually talks to the API.
+@functools.lru_cache(maxsize=1)
+def _report_cache() -> "ReportCache":
+    """On-disk report cache shared by every subcommand in this process"""
+    from .cache import ReportCache
+
+    return ReportCache()
+
+
+def _data_client(property_id: str, no_cache: bool) -> "GA4DataClient":
+    """Get the shared data client, backed by the on-disk report cache unless disabled"""
+    from .client import get_data_client
+
+    return get_data_client(property_id, cache=None if no_cache else _report_cache())
+
+
+def _admin_client(ctx: click.Context, property_id: str) -> "GA4AdminClient":
+    """Get the admin client for this invocation, creating it on first use"""
+    from .client import GA4AdminClient
+
+    return _ctx_cached(ctx, ("admin", property_id), lambda: GA4AdminClient(property_id))
+
+
+def _builder(ctx: click.Context, property_id: str, no_cache: bool) -> ReportBuilder:
+    """Get the report builder for this invocation, creating it on first use"""
+    return _ctx_cached(
+        ctx,
+        ("builder", property_id, no_cache),
+        lambda: ReportBuilder(_data_client(property_id, no_cache)),
+    )
+
+
+def _ctx_cached(ctx: click.Context, key: Tuple[Any, ...], factory: Callable[[], Any]) -> Any:
+    """Return ctx.obj[key], building it with factory the first time it is asked for"""
+    obj = ctx.ensure_object(dict)
+    value = obj.get(key)
+    if value is None:
+        value = obj[key] = factory()
+    return value
+
+
+class _GA4Group(click.Group):
+    """Top-level group that reports GA4 errors from any subcommand in one place"""
+
+    def invoke(self, ctx: click.Context) -> Any:
+        try:
+            return super().invoke(ctx)
+        except GA4Error as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
+
+
+@click.group(cls=_GA4Group)
+@click.pass_context
+def cli(ctx: click.Context):
     """Xwander GA4 - Google Analytics 4 operations"""
-    pass
+    # Clients and builders are stored here and shared by every subcommand
+    ctx.ensure_object(dict)
 
 
 @cli.command(epilog="""
@@ -36,12 +121,11 @@ Examples:
   # Specific date range with multiple dimensions/metrics
   xwander-ga4 report --start-date 2026-01-01 --end-date 2026-01-07 \\
     --dimensions date source --metrics sessions users --format json
+
+  # Same report for two properties, fetched in parallel
+  xwander-ga4 report --property-id 358203796,123456789 --dimensions source --metrics sessions
 """)
-@click.option(
-    "--property-id",
-    default=DEFAULT_PROPERTY_ID,
-    help="GA4 property ID (default: Xwander)",
-)
+@_property_ids_option
 @click.option("--dimensions", multiple=True, required=True, help="Dimension names")
 @click.option("--metrics", multiple=True, required=True, help="Metric names")
 @click.option("--start-date", help="Start date (YYYY-MM-DD)")
@@ -49,8 +133,11 @@ Examples:
 @click.option("--days", type=int, default=7, help="Number of days if no date range")
 @click.option("--limit", type=int, default=100, help="Max rows to return")
 @click.option("--format", type=click.Choice(["table", "json", "summary"]), default="table")
+@_no_cache_option
+@click.pass_context
 def report(
-    property_id: str,
+    ctx: click.Context,
+    property_ids: tuple,
     dimensions: tuple,
     metrics: tuple,
     start_date: Optional[str],
@@ -58,39 +145,34 @@ def report(
     days: int,
     limit: int,
     format: str,
+    no_cache: bool,
 ):
     """Run a GA4 report with custom dimensions and metrics"""
-    try:
-        data_client = GA4DataClient(property_id)
-        builder = ReportBuilder(data_client)
-
+    def run(builder: ReportBuilder) -> Dict[str, Any]:
         if start_date and end_date:
-            result = builder.date_range(
+            return builder.date_range(
                 start_date=start_date,
                 end_date=end_date,
                 dimensions=list(dimensions),
                 metrics=list(metrics),
                 limit=limit,
             )
-        else:
-            result = builder.last_n_days(
-                days=days,
-                dimensions=list(dimensions),
-                metrics=list(metrics),
-                limit=limit,
-            )
+        return builder.last_n_days(
+            days=days,
+            dimensions=list(dimensions),
+            metrics=list(metrics),
+            limit=limit,
+        )
 
-        formatter = ReportFormatter()
-        if format == "table":
-            click.echo(formatter.table(result))
-        elif format == "json":
-            click.echo(formatter.json(result))
-        else:
-            click.echo(formatter.summary(result))
+    results = _per_property(ctx, property_ids, no_cache, run)
 
-    except GA4Error as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    formatter = ReportFormatter()
+    if format == "table":
+        _echo_per_property(results, formatter.table)
+    elif format == "json":
+        _echo_per_property(results, formatter.json)
+    else:
+        _echo_per_property(results, formatter.summary)
 
 
 @cli.command(epilog="""
@@ -102,34 +184,28 @@ Examples:
   # Custom dimensions
   xwander-ga4 realtime --dimensions country city source --metrics activeUsers
 """)
-@click.option(
-    "--property-id",
-    default=DEFAULT_PROPERTY_ID,
-    help="GA4 property ID",
-)
+@_property_id_option
 @click.option("--dimensions", multiple=True, help="Dimension names")
 @click.option("--metrics", multiple=True, help="Metric names")
-def realtime(property_id: str, dimensions: tuple, metrics: tuple):
+@_no_cache_option
+@click.pass_context
+def realtime(
+    ctx: click.Context, property_id: str, dimensions: tuple, metrics: tuple, no_cache: bool
+):
     """Run realtime GA4 report showing active users now"""
-    try:
-        data_client = GA4DataClient(property_id)
-        builder = ReportBuilder(data_client)
+    builder = _builder(ctx, property_id, no_cache)
 
-        if dimensions and metrics:
-            result = data_client.run_realtime_report(
-                dimensions=list(dimensions),
-                metrics=list(metrics),
-                limit=20,
-            )
-        else:
-            result = builder.realtime_summary()
-
-        formatter = ReportFormatter()
-        click.echo(formatter.table(result))
+    if dimensions and metrics:
+        result = builder.client.run_realtime_report(
+            dimensions=list(dimensions),
+            metrics=list(metrics),
+            limit=20,
+        )
+    else:
+        result = builder.realtime_summary()
 
-    except GA4Error as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    formatter = ReportFormatter()
+    click.echo(formatter.table(result))
 
 
 @cli.command("traffic-sources", epilog="""
@@ -141,26 +217,20 @@ Examples:
   # Last 7 days, top 20 sources
   xwander-ga4 traffic-sources --days 7 --limit 20
 """)
-@click.option(
-    "--property-id",
-    default=DEFAULT_PROPERTY_ID,
-    help="GA4 property ID",
-)
-@click.option("--days", type=int, default=30, help="Number of days")
+@_property_ids_option
+@_days_option
 @click.option("--limit", type=int, default=50, help="Max rows")
-def traffic_sources(property_id: str, days: int, limit: int):
+@_no_cache_option
+@click.pass_context
+def traffic_sources(ctx: click.Context, property_ids: tuple, days: int, limit: int, no_cache: bool):
     """Get traffic breakdown by source and medium"""
-    try:
-        data_client = GA4DataClient(property_id)
-        builder = ReportBuilder(data_client)
-        result = builder.traffic_sources(days=days, limit=limit)
-
-        formatter = ReportFormatter()
-        click.echo(formatter.table(result))
-
-    except GA4Error as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    results = _per_property(
+        ctx,
+        property_ids,
+        no_cache,
+        lambda builder: builder.traffic_sources(days=days, limit=limit),
+    )
+    _echo_per_property(results, ReportFormatter.table)
 
 
 @cli.command("top-pages", epilog="""
@@ -172,26 +242,20 @@ Examples:
   # Last 7 days, top 10 pages
   xwander-ga4 top-pages --days 7 --limit 10
 """)
-@click.option(
-    "--property-id",
-    default=DEFAULT_PROPERTY_ID,
-    help="GA4 property ID",
-)
-@click.option("--days", type=int, default=30, help="Number of days")
+@_property_ids_option
+@_days_option
 @click.option("--limit", type=int, default=50, help="Max rows")
-def top_pages(property_id: str, days: int, limit: int):
+@_no_cache_option
+@click.pass_context
+def top_pages(ctx: click.Context, property_ids: tuple, days: int, limit: int, no_cache: bool):
     """Get top pages ranked by sessions"""
-    try:
-        data_client = GA4DataClient(property_id)
-        builder = ReportBuilder(data_client)
-        result = builder.top_pages(days=days, limit=limit)
-
-        formatter = ReportFormatter()
-        click.echo(formatter.table(result))
-
-    except GA4Error as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    results = _per_property(
+        ctx,
+        property_ids,
+        no_cache,
+        lambda builder: builder.top_pages(days=days, limit=limit),
+    )
+    _echo_per_property(results, ReportFormatter.table)
 
 
 @cli.command("conversions", epilog="""
@@ -203,26 +267,20 @@ Examples:
   # Last 7 days
   xwander-ga4 conversions --days 7
 """)
-@click.option(
-    "--property-id",
-    default=DEFAULT_PROPERTY_ID,
-    help="GA4 property ID",
-)
-@click.option("--days", type=int, default=30, help="Number of days")
+@_property_ids_option
+@_days_option
 @click.option("--limit", type=int, default=100, help="Max rows")
-def conversions(property_id: str, days: int, limit: int):
+@_no_cache_option
+@click.pass_context
+def conversions(ctx: click.Context, property_ids: tuple, days: int, limit: int, no_cache: bool):
     """Get conversion events with counts and values"""
-    try:
-        data_client = GA4DataClient(property_id)
-        builder = ReportBuilder(data_client)
-        result = builder.conversions(days=days, limit=limit)
-
-        formatter = ReportFormatter()
-        click.echo(formatter.table(result))
-
-    except GA4Error as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    results = _per_property(
+        ctx,
+        property_ids,
+        no_cache,
+        lambda builder: builder.conversions(days=days, limit=limit),
+    )
+    _echo_per_property(results, ReportFormatter.table)
 
 
 @cli.command("daily-summary", epilog="""
@@ -234,25 +292,83 @@ Examples:
   # Last 7 days
   xwander-ga4 daily-summary --days 7
 """)
-@click.option(
-    "--property-id",
-    default=DEFAULT_PROPERTY_ID,
-    help="GA4 property ID",
-)
-@click.option("--days", type=int, default=30, help="Number of days")
-def daily_summary(property_id: str, days: int):
+@_property_ids_option
+@_days_option
+@_no_cache_option
+@click.pass_context
+def daily_summary(ctx: click.Context, property_ids: tuple, days: int, no_cache: bool):
     """Get daily metrics summary (sessions, users, events)"""
-    try:
-        data_client = GA4DataClient(property_id)
-        builder = ReportBuilder(data_client)
-        result = builder.daily_summary(days=days)
+    results = _per_property(
+        ctx,
+        property_ids,
+        no_cache,
+        lambda builder: builder.daily_summary(days=days),
+    )
+    _echo_per_property(results, ReportFormatter.table)
 
-        formatter = ReportFormatter()
-        click.echo(formatter.table(result))
 
-    except GA4Error as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+@cli.command("dashboard", epilog="""
+Examples:
+
+  # Traffic, pages, conversions and daily summary for the last 30 days
+  xwander-ga4 dashboard
+
+  # Last 7 days, top 10 rows per report
+  xwander-ga4 dashboard --days 7 --limit 10
+""")
+@_property_id_option
+@_days_option
+@click.option("--limit", type=int, default=50, help="Max rows per report")
+@_no_cache_option
+@click.pass_context
+def dashboard(ctx: click.Context, property_id: str, days: int, limit: int, no_cache: bool):
+    """Get the standard reports in a single batched API call"""
+    builder = _builder(ctx, property_id, no_cache)
+    results = builder.dashboard(days=days, limit=limit)
+
+    formatter = ReportFormatter()
+    sections = [
+        f"== {name.replace('_', ' ').title()} ==\n{formatter.table(result)}"
+        for name, result in results.items()
+    ]
+    click.echo("\n\n".join(sections))
+
+
+def _split_property_ids(values: Tuple[str, ...]) -> List[str]:
+    """Flatten repeated/comma-separated --property-id values, dropping duplicates"""
+    ids = (pid.strip() for value in values for pid in value.split(","))
+    return list(dict.fromkeys(pid for pid in ids if pid))
+
+
+def _per_property(
+    ctx: click.Context,
+    property_ids: Tuple[str, ...],
+    no_cache: bool,
+    run: Callable[[ReportBuilder], Dict[str, Any]],
+) -> Dict[str, Dict[str, Any]]:
+    """Run a report for each property, in parallel threads when there are several"""
+    ids = _split_property_ids(property_ids)
+
+    def run_one(property_id: str) -> Dict[str, Any]:
+        return run(_builder(ctx, property_id, no_cache))
+
+    if len(ids) == 1:
+        return {ids[0]: run_one(ids[0])}
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_PROPERTIES, len(ids))) as executor:
+        return dict(zip(ids, executor.map(run_one, ids)))
+
+
+def _echo_per_property(
+    results: Dict[str, Dict[str, Any]], render: Callable[[Dict[str, Any]], str]
+) -> None:
+    """Print one report, or one titled section per property"""
+    if len(results) == 1:
+        click.echo(render(next(iter(results.values()))))
+        return
+    click.echo(
+        "\n\n".join(f"== Property {pid} ==\n{render(result)}" for pid, result in results.items())
+    )
 
 
 # Dimension commands
@@ -277,45 +393,37 @@ Examples:
     --parameter-name customer_segment \\
     --scope USER
 """)
-@click.option(
-    "--property-id",
-    default=DEFAULT_PROPERTY_ID,
-    help="GA4 property ID",
-)
+@_property_id_option
 @click.option("--display-name", required=True, help="Display name")
 @click.option("--parameter-name", required=True, help="Parameter name")
 @click.option(
     "--scope",
-    type=click.Choice(["EVENT", "USER", "ITEM"]),
+    type=_SCOPE_CHOICE,
     default="EVENT",
     help="Dimension scope",
 )
 @click.option("--description", default="", help="Description")
+@click.pass_context
 def create_dimension(
-    property_id: str, display_name: str, parameter_name: str, scope: str, description: str
+    ctx: click.Context,
+    property_id: str,
+    display_name: str,
+    parameter_name: str,
+    scope: str,
+    description: str,
 ):
     """Create custom dimension (parameter name must be alphanumeric + underscore)"""
-    try:
-        admin_client = GA4AdminClient(property_id)
-        manager = DimensionManager(admin_client)
-
-        # Validate
-        DimensionManager.validate_display_name(display_name)
-        DimensionManager.validate_parameter_name(parameter_name)
-
-        result = manager.create(
-            display_name=display_name,
-            parameter_name=parameter_name,
-            scope=scope,
-            description=description,
-        )
+    admin_client = _admin_client(ctx, property_id)
+    manager = DimensionManager(admin_client)
+    result = manager.create(
+        display_name=display_name,
+        parameter_name=parameter_name,
+        scope=scope,
+        description=description,
+    )
 
-        click.echo(f"Created: {result['api_name']}")
-        click.echo(json.dumps(result, indent=2))
-
-    except GA4Error as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    click.echo(f"Created: {result['api_name']}")
+    click.echo(ReportFormatter.json(result))
 
 
 @dimension_group.command("list", epilog="""
@@ -326,42 +434,43 @@ Examples:
 
   # List only event-scoped dimensions
   xwander-ga4 dimension list --scope EVENT
+
+  # One JSON object per line (NDJSON)
+  xwander-ga4 dimension list --json
 """)
-@click.option(
-    "--property-id",
-    default=DEFAULT_PROPERTY_ID,
-    help="GA4 property ID",
-)
+@_property_id_option
 @click.option(
     "--scope",
-    type=click.Choice(["EVENT", "USER", "ITEM"]),
+    type=_SCOPE_CHOICE,
     help="Filter by scope",
 )
-def list_dimensions(property_id: str, scope: Optional[str]):
+@_ndjson_option
+@click.pass_context
+def list_dimensions(ctx: click.Context, property_id: str, scope: Optional[str], as_json: bool):
     """List all custom dimensions for property"""
-    try:
-        admin_client = GA4AdminClient(property_id)
-        manager = DimensionManager(admin_client)
-
-        if scope:
-            dimensions = manager.by_scope(scope)
-        else:
-            dimensions = manager.list()
-
-        if not dimensions:
-            click.echo("No custom dimensions found")
-            return
-
-        for dim in dimensions:
-            click.echo(f"\n{dim['display_name']} ({dim['api_name']})")
-            click.echo(f"  Parameter: {dim['parameter_name']}")
-            click.echo(f"  Scope: {dim['scope']}")
-            if dim.get("description"):
-                click.echo(f"  Description: {dim['description']}")
-
-    except GA4Error as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    admin_client = _admin_client(ctx, property_id)
+    manager = DimensionManager(admin_client)
+
+    if scope:
+        dimensions = manager.by_scope(scope)
+    else:
+        # Stream so the first dimensions print while later pages are fetched
+        dimensions = manager.stream()
+
+    found = False
+    for dim in dimensions:
+        found = True
+        if as_json:
+            click.echo(ReportFormatter.json(dim, indent=False))
+            continue
+        click.echo(f"\n{dim['display_name']} ({dim['api_name']})")
+        click.echo(f"  Parameter: {dim['parameter_name']}")
+        click.echo(f"  Scope: {dim['scope']}")
+        if dim.get("description"):
+            click.echo(f"  Description: {dim['description']}")
+
+    if not found and not as_json:
+        click.echo("No custom dimensions found")
 
 
 # Audience commands
@@ -379,38 +488,39 @@ Examples:
 
   # List audiences sorted by member count (largest first)
   xwander-ga4 audience list --sort-by-size
+
+  # One JSON object per line (NDJSON)
+  xwander-ga4 audience list --json
 """)
-@click.option(
-    "--property-id",
-    default=DEFAULT_PROPERTY_ID,
-    help="GA4 property ID",
-)
+@_property_id_option
 @click.option("--sort-by-size", is_flag=True, help="Sort by member count")
-def list_audiences(property_id: str, sort_by_size: bool):
+@_ndjson_option
+@click.pass_context
+def list_audiences(ctx: click.Context, property_id: str, sort_by_size: bool, as_json: bool):
     """List all audiences in property"""
-    try:
-        admin_client = GA4AdminClient(property_id)
-        manager = AudienceManager(admin_client)
-
-        if sort_by_size:
-            audiences = manager.sorted_by_size()
-        else:
-            audiences = manager.list()
+    admin_client = _admin_client(ctx, property_id)
+    manager = AudienceManager(admin_client)
 
-        if not audiences:
-            click.echo("No audiences found")
-            return
+    if sort_by_size:
+        audiences = manager.sorted_by_size()
+    else:
+        audiences = manager.list()
 
+    if as_json:
         for audience in audiences:
-            click.echo(f"\n{audience['name']}")
-            click.echo(f"  ID: {audience['audience_id']}")
-            click.echo(f"  Members: {audience['member_count']:,}")
-            if audience.get("description"):
-                click.echo(f"  Description: {audience['description']}")
+            click.echo(ReportFormatter.json(audience, indent=False))
+        return
 
-    except GA4Error as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    if not audiences:
+        click.echo("No audiences found")
+        return
+
+    for audience in audiences:
+        click.echo(f"\n{audience['name']}")
+        click.echo(f"  ID: {audience['audience_id']}")
+        click.echo(f"  Members: {audience['member_count']:,}")
+        if audience.get("description"):
+            click.echo(f"  Description: {audience['description']}")
 
 
 @audience_group.command("search", epilog="""
@@ -422,31 +532,23 @@ Examples:
   # Search for paid search audiences
   xwander-ga4 audience search paid_search
 """)
-@click.option(
-    "--property-id",
-    default=DEFAULT_PROPERTY_ID,
-    help="GA4 property ID",
-)
+@_property_id_option
 @click.argument("name_pattern")
-def search_audiences(property_id: str, name_pattern: str):
+@click.pass_context
+def search_audiences(ctx: click.Context, property_id: str, name_pattern: str):
     """Search audiences by name pattern (case-insensitive)"""
-    try:
-        admin_client = GA4AdminClient(property_id)
-        manager = AudienceManager(admin_client)
-        audiences = manager.filter_by_name(name_pattern)
-
-        if not audiences:
-            click.echo(f"No audiences matching '{name_pattern}'")
-            return
-
-        for audience in audiences:
-            click.echo(f"\n{audience['name']}")
-            click.echo(f"  ID: {audience['audience_id']}")
-            click.echo(f"  Members: {audience['member_count']:,}")
-
-    except GA4Error as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    admin_client = _admin_client(ctx, property_id)
+    manager = AudienceManager(admin_client)
+    audiences = manager.filter_by_name(name_pattern)
+
+    if not audiences:
+        click.echo(f"No audiences matching '{name_pattern}'")
+        return
+
+    for audience in audiences:
+        click.echo(f"\n{audience['name']}")
+        click.echo(f"  ID: {audience['audience_id']}")
+        click.echo(f"  Members: {audience['member_count']:,}")
 
 
 if __name__ == "__main__":
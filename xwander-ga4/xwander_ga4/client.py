@@ -1,13 +1,19 @@
 """GA4 Data API and Admin API clients"""
 
+import asyncio
+import functools
 import os
-from typing import Any, Dict, List, Optional
-from google.analytics.data_v1beta import BetaAnalyticsDataClient
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+from google.analytics.data_v1beta import BetaAnalyticsDataAsyncClient, BetaAnalyticsDataClient
 from google.analytics.admin_v1beta import AnalyticsAdminServiceClient
 from google.analytics.data_v1beta.types import (
+    BatchRunReportsRequest,
     DateRange,
     Dimension,
     Metric,
+    PropertyQuota,
     RunReportRequest,
     RunRealtimeReportRequest,
 )
@@ -15,29 +21,89 @@ from google.analytics.admin_v1beta.types import (
     CustomDimension,
 )
 from google.api_core.gapic_v1 import client_info
+from google.protobuf.json_format import MessageToDict
 
+from .cache import ReportCache
+from .dimensions import DimensionManager
 from .exceptions import GA4ConfigError, GA4APIError, GA4ValidationError
 
 
+# batchRunReports accepts at most this many requests per call
+MAX_BATCH_REPORTS = 5
+
+# GA4 allows 10 concurrent requests per property
+MAX_CONCURRENT_REQUESTS = 10
+
+# Dimension values shorter than this are interned (source, medium, country, ...)
+INTERN_MAX_LENGTH = 32
+
+# Largest page the Admin API list methods return
+ADMIN_PAGE_SIZE = 200
+
+
+def _intern_value(value: str) -> str:
+    """Intern short, typically low-cardinality dimension values"""
+    return sys.intern(value) if len(value) < INTERN_MAX_LENGTH else value
+
+
+@functools.lru_cache(maxsize=4)
+def _data_api_client(credentials_path: Optional[str]) -> BetaAnalyticsDataClient:
+    """Shared Data API client per credentials file, so its gRPC channel is reused"""
+    return BetaAnalyticsDataClient()
+
+
+@functools.lru_cache(maxsize=4)
+def _admin_api_client(credentials_path: Optional[str]) -> AnalyticsAdminServiceClient:
+    """Shared Admin API client per credentials file, so its gRPC channel is reused"""
+    return AnalyticsAdminServiceClient()
+
+
+def _prefetched_pages(pager) -> Iterator[Any]:
+    """
+    Yield the pages of an Admin API pager, fetching the next page in a
+    background thread while the caller processes the current one
+
+    Page tokens chain, so at most one page is ever in flight.
+    """
+    pages = iter(pager.pages)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(next, pages, None)
+        while True:
+            page = future.result()
+            if page is None:
+                return
+            future = executor.submit(next, pages, None)
+            yield page
+
+
 class GA4DataClient:
     """Google Analytics 4 Data API client"""
 
-    def __init__(self, property_id: str, credentials_path: Optional[str] = None):
+    def __init__(
+        self,
+        property_id: str,
+        credentials_path: Optional[str] = None,
+        cache: Optional[ReportCache] = None,
+    ):
         """
         Initialize GA4 Data API client
 
         Args:
             property_id: GA4 property ID (e.g., '358203796')
             credentials_path: Path to service account JSON (default: GOOGLE_APPLICATION_CREDENTIALS)
+            cache: Optional ReportCache to reuse recent report responses
         """
         self.property_id = property_id
         self.property_resource = f"properties/{property_id}"
+        self.cache = cache
+        self._async_client = None
+        self._async_loop = None
 
         if credentials_path:
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = credentials_path
 
         try:
-            self.client = BetaAnalyticsDataClient()
+            self.client = _data_api_client(os.environ.get("GOOGLE_APPLICATION_CREDENTIALS"))
         except Exception as e:
             raise GA4ConfigError(f"Failed to initialize GA4 Data API: {e}")
 
@@ -67,7 +133,176 @@ class GA4DataClient:
         if not date_ranges or not dimensions or not metrics:
             raise GA4ValidationError("date_ranges, dimensions, and metrics are required")
 
-        # Build request
+        cache_key = self._report_cache_key(
+            date_ranges, dimensions, metrics, limit, offset, order_bys
+        )
+        if cache_key is not None:
+            cached = self.cache.get(cache_key, self.cache.ttl)
+            if cached is not None:
+                return cached
+
+        request = self._build_report_request(
+            date_ranges, dimensions, metrics, limit, offset, order_bys
+        )
+
+        try:
+            response = self.client.run_report(request)
+            result = self._format_report_response(response)
+        except Exception as e:
+            raise GA4APIError(f"Failed to run report: {e}")
+
+        if cache_key is not None:
+            self.cache.set(cache_key, result)
+        return result
+
+    async def run_report_async(
+        self,
+        date_ranges: List[Dict[str, str]],
+        dimensions: List[str],
+        metrics: List[str],
+        limit: int = 10,
+        offset: int = 0,
+        order_bys: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run a GA4 report on the async Data API client
+
+        Same arguments and result as run_report().
+        """
+        if not date_ranges or not dimensions or not metrics:
+            raise GA4ValidationError("date_ranges, dimensions, and metrics are required")
+
+        cache_key = self._report_cache_key(
+            date_ranges, dimensions, metrics, limit, offset, order_bys
+        )
+        if cache_key is not None:
+            cached = self.cache.get(cache_key, self.cache.ttl)
+            if cached is not None:
+                return cached
+
+        request = self._build_report_request(
+            date_ranges, dimensions, metrics, limit, offset, order_bys
+        )
+
+        try:
+            loop = asyncio.get_running_loop()
+            if self._async_client is None or self._async_loop is not loop:
+                # The async transport binds to the event loop it was built on,
+                # and each asyncio.run() starts a new one, so build one per loop
+                self._async_client = BetaAnalyticsDataAsyncClient()
+                self._async_loop = loop
+            response = await self._async_client.run_report(request)
+            result = self._format_report_response(response)
+        except Exception as e:
+            raise GA4APIError(f"Failed to run report: {e}")
+
+        if cache_key is not None:
+            self.cache.set(cache_key, result)
+        return result
+
+    async def run_reports_async(
+        self,
+        reports: List[Dict[str, Any]],
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several independent reports concurrently
+
+        Args:
+            reports: List of run_report keyword dicts
+            max_concurrency: Max requests in flight (GA4 quota: 10 per property)
+
+        Returns:
+            List of report dicts, in request order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(report: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.run_report_async(**report)
+
+        return await asyncio.gather(*(run_one(report) for report in reports))
+
+    def batch_run_reports(self, reports: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run up to 5 GA4 reports in a single batchRunReports call
+
+        Args:
+            reports: List of run_report keyword dicts (date_ranges, dimensions,
+                metrics and optional limit, offset, order_bys)
+
+        Returns:
+            List of report dicts (rows, row_count, property_quota), in request order
+        """
+        if not reports:
+            raise GA4ValidationError("At least one report is required")
+        if len(reports) > MAX_BATCH_REPORTS:
+            raise GA4ValidationError(
+                f"A batch can hold at most {MAX_BATCH_REPORTS} reports"
+            )
+        for report in reports:
+            if not (report.get("date_ranges") and report.get("dimensions") and report.get("metrics")):
+                raise GA4ValidationError("date_ranges, dimensions, and metrics are required")
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ReportCache.make_key("batch", self.property_id, reports)
+            cached = self.cache.get(cache_key, self.cache.ttl)
+            if cached is not None:
+                return cached["reports"]
+
+        request = BatchRunReportsRequest(
+            property=self.property_resource,
+            requests=[
+                self._build_report_request(
+                    report["date_ranges"],
+                    report["dimensions"],
+                    report["metrics"],
+                    report.get("limit", 10),
+                    report.get("offset", 0),
+                    report.get("order_bys"),
+                )
+                for report in reports
+            ],
+        )
+
+        try:
+            response = self.client.batch_run_reports(request)
+            results = [self._format_report_response(r) for r in response.reports]
+        except Exception as e:
+            raise GA4APIError(f"Failed to run batch reports: {e}")
+
+        if cache_key is not None:
+            self.cache.set(cache_key, {"reports": results})
+        return results
+
+    def _report_cache_key(
+        self,
+        date_ranges: List[Dict[str, str]],
+        dimensions: List[str],
+        metrics: List[str],
+        limit: int,
+        offset: int,
+        order_bys: Optional[List[Dict[str, Any]]],
+    ) -> Optional[str]:
+        """Cache key for a run_report request, or None when caching is off"""
+        if self.cache is None:
+            return None
+        return ReportCache.make_key(
+            "report", self.property_id, dimensions, metrics,
+            date_ranges, limit, offset, order_bys,
+        )
+
+    def _build_report_request(
+        self,
+        date_ranges: List[Dict[str, str]],
+        dimensions: List[str],
+        metrics: List[str],
+        limit: int,
+        offset: int,
+        order_bys: Optional[List[Dict[str, Any]]],
+    ) -> RunReportRequest:
+        """Build a RunReportRequest for this property"""
         request = RunReportRequest(
             property=self.property_resource,
             date_ranges=[
@@ -78,16 +313,13 @@ class GA4DataClient:
             metrics=[Metric(name=met) for met in metrics],
             limit=limit,
             offset=offset,
+            return_property_quota=True,
         )
 
         if order_bys:
             request.order_bys = order_bys
 
-        try:
-            response = self.client.run_report(request)
-            return self._format_report_response(response)
-        except Exception as e:
-            raise GA4APIError(f"Failed to run report: {e}")
+        return request
 
     def run_realtime_report(
         self,
@@ -109,6 +341,15 @@ class GA4DataClient:
         if not dimensions or not metrics:
             raise GA4ValidationError("dimensions and metrics are required")
 
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ReportCache.make_key(
+                "realtime", self.property_id, dimensions, metrics, limit
+            )
+            cached = self.cache.get(cache_key, self.cache.realtime_ttl)
+            if cached is not None:
+                return cached
+
         request = RunRealtimeReportRequest(
             property=self.property_resource,
             dimensions=[Dimension(name=dim) for dim in dimensions],
@@ -118,34 +359,47 @@ class GA4DataClient:
 
         try:
             response = self.client.run_realtime_report(request)
-            return self._format_realtime_response(response)
+            result = self._format_realtime_response(response)
         except Exception as e:
             raise GA4APIError(f"Failed to run realtime report: {e}")
 
+        if cache_key is not None:
+            self.cache.set(cache_key, result)
+        return result
+
     @staticmethod
-    def _format_report_response(response) -> Dict[str, Any]:
-        """Format GA4 report response"""
+    def _format_rows(response) -> List[Dict[str, str]]:
+        """Turn response rows into dicts keyed by dimension/metric header name"""
+        # Resolve header names once; zip stops at the shorter side, like the API headers
+        dim_names = [sys.intern(header.name) for header in response.dimension_headers]
+        met_names = [sys.intern(header.name) for header in response.metric_headers]
+        names = dim_names + met_names
+        dim_count = len(dim_names)
         rows = []
         for row in response.rows:
-            row_dict = {}
-            for i, dim_value in enumerate(row.dimension_values):
-                if i < len(response.dimension_headers):
-                    row_dict[response.dimension_headers[i].name] = dim_value.value
-            for i, metric_value in enumerate(row.metric_values):
-                if i < len(response.metric_headers):
-                    row_dict[response.metric_headers[i].name] = metric_value.value
-            rows.append(row_dict)
-
-        # Build quota dict with safe attribute access (API fields may vary)
-        quota = response.property_quota
-        quota_dict = {}
-        for field in [
-            "tokens_per_day", "tokens_per_hour", "concurrent_requests",
-            "tokens_used", "tokens_remaining", "concurrent_requests_used",
-            "concurrent_requests_remaining"
-        ]:
-            if hasattr(quota, field):
-                quota_dict[field] = getattr(quota, field)
+            dim_values = row.dimension_values
+            if len(dim_values) == dim_count:
+                # Usual case: build each row dict in one go from all values
+                values = [_intern_value(v.value) for v in dim_values]
+                values.extend(v.value for v in row.metric_values)
+                rows.append(dict(zip(names, values)))
+            else:
+                row_dict = dict(zip(dim_names, [_intern_value(v.value) for v in dim_values]))
+                row_dict.update(zip(met_names, [v.value for v in row.metric_values]))
+                rows.append(row_dict)
+        return rows
+
+    @staticmethod
+    def _format_report_response(response) -> Dict[str, Any]:
+        """Format GA4 report response"""
+        rows = GA4DataClient._format_rows(response)
+
+        # One C-level walk over whatever quota fields the API returns, e.g.
+        # {"tokens_per_day": {"consumed": 12, "remaining": 199988}, ...}
+        quota_dict = MessageToDict(
+            PropertyQuota.pb(response.property_quota),
+            preserving_proto_field_name=True,
+        )
 
         return {
             "rows": rows,
@@ -156,16 +410,7 @@ class GA4DataClient:
     @staticmethod
     def _format_realtime_response(response) -> Dict[str, Any]:
         """Format GA4 realtime report response"""
-        rows = []
-        for row in response.rows:
-            row_dict = {}
-            for i, dim_value in enumerate(row.dimension_values):
-                if i < len(response.dimension_headers):
-                    row_dict[response.dimension_headers[i].name] = dim_value.value
-            for i, metric_value in enumerate(row.metric_values):
-                if i < len(response.metric_headers):
-                    row_dict[response.metric_headers[i].name] = metric_value.value
-            rows.append(row_dict)
+        rows = GA4DataClient._format_rows(response)
 
         return {
             "rows": rows,
@@ -175,6 +420,26 @@ class GA4DataClient:
         }
 
 
+@functools.lru_cache(maxsize=32)
+def get_data_client(property_id: str, cache: Optional[ReportCache] = None) -> GA4DataClient:
+    """
+    Return a shared GA4DataClient for a property
+
+    Long-running processes (web apps, repeated CLI subcommands) get the same
+    client, and so the same gRPC channel, for every call with the same
+    property and cache. The async client is shared within an event loop. Credentials are read from
+    GOOGLE_APPLICATION_CREDENTIALS when a client is first created.
+
+    Args:
+        property_id: GA4 property ID (e.g., '358203796')
+        cache: Optional ReportCache to reuse recent report responses
+
+    Returns:
+        GA4DataClient instance
+    """
+    return GA4DataClient(property_id, cache=cache)
+
+
 class GA4AdminClient:
     """Google Analytics 4 Admin API client"""
 
@@ -194,7 +459,7 @@ class GA4AdminClient:
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = credentials_path
 
         try:
-            self.client = AnalyticsAdminServiceClient()
+            self.client = _admin_api_client(os.environ.get("GOOGLE_APPLICATION_CREDENTIALS"))
         except Exception as e:
             raise GA4ConfigError(f"Failed to initialize GA4 Admin API: {e}")
 
@@ -233,6 +498,9 @@ class GA4AdminClient:
         Returns:
             Dict with custom_dimension details
         """
+        # Reject bad input before building any protobuf or spending a round trip
+        DimensionManager.validate_display_name(display_name)
+        DimensionManager.validate_parameter_name(parameter_name)
         if scope not in ["EVENT", "USER", "ITEM"]:
             raise GA4ValidationError(f"Invalid scope: {scope}")
 
@@ -267,20 +535,31 @@ class GA4AdminClient:
         Returns:
             List of custom dimensions
         """
+        return list(self.iter_custom_dimensions())
+
+    def iter_custom_dimensions(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield custom dimensions as their pages arrive
+
+        The next page is fetched in the background while the caller consumes
+        the current one, so output can start before pagination finishes.
+
+        Yields:
+            Custom dimension details
+        """
         try:
-            response = self.client.list_custom_dimensions(parent=self.property_resource)
-            dimensions = []
-            for dim in response.custom_dimensions:
-                dimensions.append(
-                    {
+            pager = self.client.list_custom_dimensions(
+                request={"parent": self.property_resource, "page_size": ADMIN_PAGE_SIZE}
+            )
+            for page in _prefetched_pages(pager):
+                for dim in page.custom_dimensions:
+                    yield {
                         "api_name": dim.api_name,
                         "display_name": dim.display_name,
                         "parameter_name": dim.parameter_name,
                         "scope": dim.scope.name,
                         "description": dim.description,
                     }
-                )
-            return dimensions
         except Exception as e:
             raise GA4APIError(f"Failed to list custom dimensions: {e}")
 
@@ -292,17 +571,20 @@ class GA4AdminClient:
             List of audiences
         """
         try:
-            response = self.client.list_audiences(parent=self.property_resource)
+            pager = self.client.list_audiences(
+                request={"parent": self.property_resource, "page_size": ADMIN_PAGE_SIZE}
+            )
             audiences = []
-            for audience in response.audiences:
-                audiences.append(
-                    {
-                        "name": audience.display_name,
-                        "audience_id": audience.name.split("/")[-1],
-                        "description": audience.description,
-                        "member_count": audience.member_count_approximate or 0,
-                    }
-                )
+            for page in _prefetched_pages(pager):
+                for audience in page.audiences:
+                    audiences.append(
+                        {
+                            "name": audience.display_name,
+                            "audience_id": audience.name.split("/")[-1],
+                            "description": audience.description,
+                            "member_count": audience.member_count_approximate or 0,
+                        }
+                    )
             return audiences
         except Exception as e:
             raise GA4APIError(f"Failed to list audiences: {e}")
@@ -1,21 +1,35 @@
 """GA4 Custom Dimensions and Metrics management"""
 
-from typing import Any, Dict, List
-from .client import GA4AdminClient
+import re
+import time
+from typing import Any, Dict, Iterator, List, Optional, TYPE_CHECKING
 from .exceptions import GA4ValidationError
 
+if TYPE_CHECKING:
+    from .client import GA4AdminClient
+
+# Valid GA4 parameter name: 1-40 ASCII letters, digits or underscores, not starting with a digit
+_PARAM_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]{0,39}\Z")
+_PARAM_CHARS_RE = re.compile(r"[A-Za-z0-9_]*\Z")
+
 
 class DimensionManager:
     """Manage GA4 custom dimensions"""
 
-    def __init__(self, admin_client: GA4AdminClient):
+    def __init__(self, admin_client: "GA4AdminClient", cache_ttl: float = 5.0):
         """
         Initialize DimensionManager
 
         Args:
             admin_client: GA4AdminClient instance for API access
+            cache_ttl: Seconds the query helpers reuse a fetched dimension list
         """
         self.admin = admin_client
+        self.cache_ttl = cache_ttl
+        self._cache: Optional[List[Dict[str, Any]]] = None
+        self._cache_ts = 0.0
+        self._by_scope: Dict[str, List[Dict[str, Any]]] = {}
+        self._by_name: Dict[str, Dict[str, Any]] = {}
 
     def create(
         self,
@@ -36,39 +50,68 @@ class DimensionManager:
         Returns:
             Created dimension details
         """
-        return self.admin.create_custom_dimension(
+        result = self.admin.create_custom_dimension(
             display_name=display_name,
             parameter_name=parameter_name,
             scope=scope,
             description=description,
         )
+        self._cache = None
+        return result
 
     def list(self) -> List[Dict[str, Any]]:
-        """List all custom dimensions"""
-        return self.admin.list_custom_dimensions()
+        """List all custom dimensions (always hits the API and refreshes the cache)"""
+        return list(self.stream())
+
+    def stream(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield custom dimensions as they are fetched
+
+        Always hits the API; the cache is refreshed once the listing has been
+        consumed in full.
+        """
+        dimensions = []
+        # Index by scope and parameter name in the same pass (first name match wins)
+        by_scope: Dict[str, List[Dict[str, Any]]] = {}
+        by_name: Dict[str, Dict[str, Any]] = {}
+        for dim in self.admin.iter_custom_dimensions():
+            dimensions.append(dim)
+            by_scope.setdefault(dim["scope"], []).append(dim)
+            by_name.setdefault(dim["parameter_name"], dim)
+            yield dim
+
+        self._cache = dimensions
+        self._cache_ts = time.monotonic()
+        self._by_scope = by_scope
+        self._by_name = by_name
+
+    def _fetch(self) -> List[Dict[str, Any]]:
+        """Return the cached dimension list, refetching once it is older than cache_ttl"""
+        if self._cache is None or time.monotonic() - self._cache_ts >= self.cache_ttl:
+            return self.list()
+        return self._cache
 
     def by_scope(self, scope: str) -> List[Dict[str, Any]]:
         """Get custom dimensions for a scope"""
-        dimensions = self.list()
-        return [d for d in dimensions if d["scope"] == scope]
+        self._fetch()
+        return list(self._by_scope.get(scope, ()))
 
     def get_by_name(self, parameter_name: str) -> Dict[str, Any]:
         """Get dimension by parameter name"""
-        dimensions = self.list()
-        for dim in dimensions:
-            if dim["parameter_name"] == parameter_name:
-                return dim
-        return None
+        self._fetch()
+        return self._by_name.get(parameter_name)
 
     @staticmethod
     def validate_parameter_name(name: str) -> None:
         """Validate parameter name format"""
+        if _PARAM_RE.match(name):
+            return
+        # Invalid: work out which rule failed for the error message
         if not name or len(name) > 40:
             raise GA4ValidationError("Parameter name must be 1-40 characters")
-        if not all(c.isalnum() or c == "_" for c in name):
+        if not _PARAM_CHARS_RE.match(name):
             raise GA4ValidationError("Parameter name must be alphanumeric + underscore")
-        if name[0].isdigit():
-            raise GA4ValidationError("Parameter name cannot start with digit")
+        raise GA4ValidationError("Parameter name cannot start with digit")
 
     @staticmethod
     def validate_display_name(name: str) -> None:
@@ -1,15 +1,57 @@
 """GA4 Report builders and formatters"""
 
+import functools
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-from .client import GA4DataClient
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
 from .exceptions import GA4ValidationError
 
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install xwander-ga4[fast]
+    orjson = None
+
+if TYPE_CHECKING:
+    from .client import GA4DataClient
+
+
+# Dimensions, metrics and sort order of the standard reports
+_TRAFFIC_SOURCES = {
+    "dimensions": ["source", "medium"],
+    "metrics": ["sessions", "activeUsers", "bounceRate"],
+    "order_bys": [{"metric": {"metric_name": "sessions"}, "desc": True}],
+}
+_TOP_PAGES = {
+    "dimensions": ["pagePath"],
+    "metrics": ["sessions", "activeUsers", "averageSessionDuration"],
+    "order_bys": [{"metric": {"metric_name": "sessions"}, "desc": True}],
+}
+_CONVERSIONS = {
+    "dimensions": ["eventName"],
+    "metrics": ["eventCount", "eventValue"],
+    "order_bys": [{"metric": {"metric_name": "eventCount"}, "desc": True}],
+}
+_DAILY_SUMMARY = {
+    "dimensions": ["date"],
+    "metrics": ["sessions", "activeUsers", "eventCount"],
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _date_range_strings(days: int, epoch_minute: int) -> Tuple[str, str]:
+    """(start, end) YYYY-MM-DD strings for the last N days as of the given minute"""
+    end_date = datetime.fromtimestamp(epoch_minute * 60).date()
+    start_date = end_date - timedelta(days=days)
+    return start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
+
 
 class ReportBuilder:
     """Build and run GA4 reports"""
 
-    def __init__(self, client: GA4DataClient):
+    def __init__(self, client: "GA4DataClient"):
         self.client = client
 
     def last_n_days(
@@ -33,25 +75,30 @@ class ReportBuilder:
         Returns:
             Report with rows and quota
         """
-        if days < 1 or days > 730:
-            raise GA4ValidationError("Days must be between 1 and 730")
-
-        end_date = datetime.now().date()
-        start_date = end_date - timedelta(days=days)
-
         return self.client.run_report(
-            date_ranges=[
-                {
-                    "start_date": start_date.strftime("%Y-%m-%d"),
-                    "end_date": end_date.strftime("%Y-%m-%d"),
-                }
-            ],
+            date_ranges=self._last_n_days_range(days),
             dimensions=dimensions,
             metrics=metrics,
             limit=limit,
             order_bys=order_bys,
         )
 
+    @staticmethod
+    def _validate_days(days: int) -> int:
+        """Return days if it is within GA4's 1-730 day lookback"""
+        if not 1 <= days <= 730:
+            raise GA4ValidationError("Days must be between 1 and 730")
+        return days
+
+    @staticmethod
+    def _last_n_days_range(days: int) -> List[Dict[str, str]]:
+        """Date range list covering the last N days (1-730)"""
+        ReportBuilder._validate_days(days)
+
+        # Keyed on the current minute, so reports built together share one computation
+        start_date, end_date = _date_range_strings(days, int(time.time() // 60))
+        return [{"start_date": start_date, "end_date": end_date}]
+
     def date_range(
         self,
         start_date: str,
@@ -85,42 +132,89 @@ class ReportBuilder:
 
     def traffic_sources(self, days: int = 30, limit: int = 50) -> Dict[str, Any]:
         """Traffic by source/medium"""
-        return self.last_n_days(
-            days=days,
-            dimensions=["source", "medium"],
-            metrics=["sessions", "activeUsers", "bounceRate"],
-            limit=limit,
-            order_bys=[{"metric": {"metric_name": "sessions"}, "desc": True}],
-        )
+        return self.last_n_days(days=days, limit=limit, **_TRAFFIC_SOURCES)
 
     def top_pages(self, days: int = 30, limit: int = 50) -> Dict[str, Any]:
         """Top pages by sessions"""
-        return self.last_n_days(
-            days=days,
-            dimensions=["pagePath"],
-            metrics=["sessions", "activeUsers", "averageSessionDuration"],
-            limit=limit,
-            order_bys=[{"metric": {"metric_name": "sessions"}, "desc": True}],
-        )
+        return self.last_n_days(days=days, limit=limit, **_TOP_PAGES)
 
     def conversions(self, days: int = 30, limit: int = 100) -> Dict[str, Any]:
         """Conversion actions and counts"""
-        return self.last_n_days(
-            days=days,
-            dimensions=["eventName"],
-            metrics=["eventCount", "eventValue"],
-            limit=limit,
-            order_bys=[{"metric": {"metric_name": "eventCount"}, "desc": True}],
-        )
+        return self.last_n_days(days=days, limit=limit, **_CONVERSIONS)
 
     def daily_summary(self, days: int = 30) -> Dict[str, Any]:
         """Daily metrics summary"""
-        return self.last_n_days(
-            days=days,
-            dimensions=["date"],
-            metrics=["sessions", "activeUsers", "eventCount"],
-            limit=days + 1,
+        return self.last_n_days(days=days, limit=days + 1, **_DAILY_SUMMARY)
+
+    def dashboard(self, days: int = 30, limit: int = 50) -> Dict[str, Dict[str, Any]]:
+        """
+        Traffic sources, top pages, conversions and daily summary in one API call
+
+        Args:
+            days: Number of days (1-730)
+            limit: Max rows for the traffic, pages and conversions reports
+
+        Returns:
+            Dict of report name -> report (rows, row_count, property_quota)
+        """
+        date_ranges = self._last_n_days_range(days)
+        specs = {
+            "traffic_sources": dict(_TRAFFIC_SOURCES, limit=limit),
+            "top_pages": dict(_TOP_PAGES, limit=limit),
+            "conversions": dict(_CONVERSIONS, limit=limit),
+            "daily_summary": dict(_DAILY_SUMMARY, limit=days + 1),
+        }
+        reports = self.run_batch(
+            [dict(spec, date_ranges=date_ranges) for spec in specs.values()]
         )
+        return dict(zip(specs, reports))
+
+    def dashboard_parallel(self, days: int = 30, limit: int = 50) -> Dict[str, Dict[str, Any]]:
+        """
+        Same reports as dashboard(), as concurrent runReport calls
+
+        For clients without batchRunReports; wall time is the slowest report
+        rather than the sum of all four.
+
+        Args:
+            days: Number of days (1-730)
+            limit: Max rows for the traffic, pages and conversions reports
+
+        Returns:
+            Dict of report name -> report (rows, row_count, property_quota)
+        """
+        self._last_n_days_range(days)  # validate before starting any threads
+        calls = {
+            "traffic_sources": lambda: self.traffic_sources(days=days, limit=limit),
+            "top_pages": lambda: self.top_pages(days=days, limit=limit),
+            "conversions": lambda: self.conversions(days=days, limit=limit),
+            "daily_summary": lambda: self.daily_summary(days=days),
+        }
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = {name: executor.submit(call) for name, call in calls.items()}
+            return {name: future.result() for name, future in futures.items()}
+
+    def run_batch(self, specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run any number of reports with as few batchRunReports calls as possible
+
+        Args:
+            specs: List of run_report keyword dicts (date_ranges, dimensions,
+                metrics and optional limit, offset, order_bys)
+
+        Returns:
+            List of reports (rows, row_count, property_quota), in spec order
+        """
+        from .client import MAX_BATCH_REPORTS
+
+        if not specs:
+            return []
+        results: List[Dict[str, Any]] = []
+        for start in range(0, len(specs), MAX_BATCH_REPORTS):
+            results.extend(
+                self.client.batch_run_reports(specs[start:start + MAX_BATCH_REPORTS])
+            )
+        return results
 
     def realtime_summary(self) -> Dict[str, Any]:
         """Realtime active users by country"""
@@ -150,54 +244,83 @@ class ReportFormatter:
             return "No data"
 
         rows = data["rows"]
-        if columns:
-            rows = [{k: v for k, v in row.items() if k in columns} for row in rows]
-
-        if not rows:
-            return "No data"
-
-        # Get column widths
         keys = list(rows[0].keys())
-        widths = {k: len(k) for k in keys}
-        for row in rows:
-            for k, v in row.items():
-                widths[k] = max(widths[k], len(str(v)))
-
-        # Build table
-        header = " | ".join(f"{k:{widths[k]}}" for k in keys)
-        separator = "-+-".join("-" * widths[k] for k in keys)
-
-        lines = [header, separator]
-        for row in rows:
-            lines.append(" | ".join(f"{str(row[k]):{widths[k]}}" for k in keys))
+        if columns:
+            # Select columns while stringifying instead of copying every row first
+            wanted = set(columns)
+            keys = [k for k in keys if k in wanted]
+
+        # Stringify every cell once, then size each column from its longest cell
+        str_rows = [[str(row[k]) for k in keys] for row in rows]
+        widths = [
+            max(len(key), max(map(len, column)))
+            for key, column in zip(keys, zip(*str_rows))
+        ]
+
+        # Build table: one left-aligned template for every line, so each row is a
+        # single str.format call
+        line = " | ".join([f"{{:<{w}}}" for w in widths])
+        lines = [line.format(*keys), "-+-".join(["-" * w for w in widths])]
+        lines += [line.format(*cells) for cells in str_rows]
 
         return "\n".join(lines)
 
     @staticmethod
-    def json(data: Dict[str, Any]) -> str:
-        """Format report as JSON"""
-        import json
+    def json(data: Any, indent: bool = True) -> str:
+        """Format report as JSON (indented, or compact for one-line output)"""
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            return orjson.dumps(data, option=option, default=str).decode()
+        # Match orjson, which writes non-ASCII text as UTF-8 rather than \u escapes
+        return json.dumps(
+            data, indent=2 if indent else None, default=str, ensure_ascii=False
+        )
 
-        return json.dumps(data, indent=2, default=str)
+    @staticmethod
+    def json_iter(data: Any, indent: bool = True) -> Iterator[str]:
+        """
+        Yield report JSON in chunks, without building the whole string
+
+        Concatenated, the chunks equal the stdlib form of json(); use this to
+        write large reports to a file or socket as they are encoded.
+        """
+        encoder = json.JSONEncoder(
+            indent=2 if indent else None, default=str, ensure_ascii=False
+        )
+        return encoder.iterencode(data)
 
     @staticmethod
     def summary(data: Dict[str, Any]) -> str:
         """Format report as summary text"""
-        lines = [f"Rows: {data.get('row_count', len(data.get('rows', [])))}"]
-
-        if data.get("rows"):
+        rows = data.get("rows") or []
+        sized = hasattr(rows, "__len__")
+        # Rows may be a lazy iterator: take one extra to know whether more follow,
+        # without draining it
+        head = list(islice(rows, 6))
+        if "row_count" in data:
+            row_count = data["row_count"]
+        elif sized:
+            row_count = len(rows)
+        else:
+            row_count = f"{len(head) - 1}+" if len(head) > 5 else len(head)
+        lines = [f"Rows: {row_count}"]
+
+        # Only the first few rows are rendered, so large reports cost O(1) here
+        if head:
             lines.append("\nData:")
-            for row in data["rows"][:5]:
-                items = [f"{k}: {v}" for k, v in row.items()]
-                lines.append("  - " + ", ".join(items))
-            if len(data["rows"]) > 5:
-                lines.append(f"  ... and {len(data['rows']) - 5} more rows")
+            for row in head[:5]:
+                lines.append("  - " + ", ".join(f"{k}: {v}" for k, v in row.items()))
+            if sized and len(rows) > 5:
+                lines.append(f"  ... and {len(rows) - 5} more rows")
+            elif not sized and len(head) > 5:
+                lines.append("  ... and more rows")
 
         if data.get("property_quota"):
-            quota = data["property_quota"]
+            daily = data["property_quota"].get("tokens_per_day") or {}
+            consumed = daily.get("consumed", 0)
             lines.append(
-                f"\nQuota: {quota.get('tokens_used', 0)} / "
-                f"{quota.get('tokens_per_day', 0)} tokens"
+                f"\nQuota: {consumed} / "
+                f"{consumed + daily.get('remaining', 0)} tokens today"
             )
 
         return "\n".join(lines)
@@ -52,8 +52,7 @@ def main():
          'retail': 18.90, 'margin': 52.4, 'note': 'Test new product - all colors'},
     ]
 
-    for p in products:
-        sheet.add_data_row(p)
+    sheet.add_data_rows(products)
 
     # Footer section (notes, actions)
     sheet.add_footer_line("")
@@ -20,6 +20,9 @@ setup(
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+        ],
     },
     classifiers=[
         "Development Status :: 4 - Beta",
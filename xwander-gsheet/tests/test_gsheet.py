@@ -10,6 +10,7 @@ import json
 import os
 import tempfile
 from unittest.mock import MagicMock, patch
+import gspread
 import pytest
 
 # Import the module under test
@@ -162,6 +163,78 @@ class TestGSheetDataOperations:
 
         assert count == 2
 
+    def test_update_data_row_keeps_row_order(self):
+        """Test rows updated to match a query come back in row order."""
+        sheet = GSheet()
+        sheet.add_data_rows([
+            {'priority': 'P1', 'product': 'Widget A'},
+            {'priority': 'P0', 'product': 'Widget B'},
+            {'priority': 'P1', 'product': 'Widget C'},
+        ])
+        assert len(sheet.find_data_rows({'priority': 'P0'})) == 1
+
+        count = sheet.update_data_row(match={'priority': 'P1'}, updates={'priority': 'P0'})
+
+        assert count == 2
+        assert [r['product'] for r in sheet.find_data_rows({'priority': 'P0'})] == [
+            'Widget A', 'Widget B', 'Widget C'
+        ]
+        assert sheet.find_data_rows({'priority': 'P1'}) == []
+
+    def test_find_data_rows_stays_current(self):
+        """Test lookups see rows added and updated after the first query."""
+        sheet = GSheet()
+        sheet.add_data_row({'priority': 'P0', 'product': 'Widget A', 'qty': 10})
+        sheet.add_data_row({'priority': 'P1', 'product': 'Widget B', 'qty': 5})
+        assert len(sheet.find_data_rows({'priority': 'P0'})) == 1
+
+        sheet.add_data_row({'priority': 'P0', 'product': 'Widget C', 'qty': 15})
+        sheet.update_data_row(match={'product': 'Widget B'}, updates={'priority': 'P0'})
+
+        p0_rows = sheet.find_data_rows({'priority': 'P0'})
+        assert [r['product'] for r in p0_rows] == ['Widget A', 'Widget B', 'Widget C']
+        assert sheet.find_data_rows({'priority': 'P0', 'qty': 15}) == [p0_rows[2]]
+
+    def test_find_data_rows_sees_in_place_changes(self):
+        """Test lookups see rows changed through a find_data_rows() result."""
+        sheet = GSheet()
+        sheet.add_data_row({'priority': 'P0'})
+        sheet.add_data_row({'priority': 'P1'})
+        assert len(sheet.find_data_rows({'priority': 'P0'})) == 1
+
+        sheet.find_data_rows({'priority': 'P1'})[0]['priority'] = 'P0'
+
+        assert len(sheet.find_data_rows({'priority': 'P0'})) == 2
+        assert sheet.update_data_row(match={'priority': 'P0'}, updates={'qty': 1}) == 2
+
+    def test_find_data_rows_several_criteria(self):
+        """Test every criterion must match, with missing columns read as None."""
+        sheet = GSheet()
+        sheet.add_data_rows([
+            {'priority': 'P0', 'qty': 1},
+            {'priority': 'P0', 'qty': 2, 'note': 'x'},
+            {'priority': 'P1', 'qty': 1},
+        ])
+
+        assert sheet.find_data_rows({'priority': 'P0', 'qty': 1}) == [{'priority': 'P0', 'qty': 1}]
+        assert len(sheet.find_data_rows({'priority': 'P0', 'note': None})) == 1
+        assert sheet.find_data_rows({'priority': 'P1', 'qty': 2}) == []
+
+    def test_add_data_rows(self):
+        """Test bulk add infers columns once and the rows are found afterwards."""
+        sheet = GSheet()
+        sheet.add_data_row({'priority': 'P0', 'product': 'Widget A', 'qty': 10})
+        assert len(sheet.find_data_rows({'priority': 'P0'})) == 1
+
+        sheet.add_data_rows([
+            {'priority': 'P0', 'product': 'Widget B', 'qty': 5},
+            {'priority': 'P1', 'product': 'Widget C', 'qty': 15},
+        ])
+
+        assert len(sheet._sections['data']['rows']) == 3
+        assert [c['name'] for c in sheet._sections['data']['columns']] == ['priority', 'product', 'qty']
+        assert [r['product'] for r in sheet.find_data_rows({'priority': 'P0'})] == ['Widget A', 'Widget B']
+
 
 class TestGSheetJsonState:
     """Test JSON state persistence."""
@@ -233,6 +306,168 @@ class TestGSheetRowBuilding:
         rows = sheet._build_section_rows(sheet._sections['data'])
         assert rows == [[1, 2], [3, 4]]
 
+    def test_sync_section_boundaries(self):
+        """Test sync lays out sections and picks up rows added since the last sync."""
+        sheet = GSheet(spreadsheet_id="abc123")
+        sheet._client = MagicMock()
+        sheet._spreadsheet = MagicMock()
+        sheet._worksheet = MagicMock()
+        sheet.set_title("TITLE")
+        sheet.set_header(['A', 'B'])
+        sheet.add_data_row({'a': 1, 'b': 2})
+
+        stats = sheet.sync()
+        assert stats['rows_updated'] == 3
+        assert sheet._section_boundaries['data'] == {'start_row': 3, 'end_row': 3}
+
+        sheet.add_data_rows([{'a': 3, 'b': 4}, {'a': 5, 'b': 6}])
+        sheet.add_footer_line("Note")
+        stats = sheet.sync()
+        assert stats['rows_updated'] == 3
+        assert sheet._section_boundaries['data'] == {'start_row': 3, 'end_row': 5}
+        assert sheet._section_boundaries['footer'] == {'start_row': 6, 'end_row': 6}
+
+    def test_sync_formats_in_one_batch(self):
+        """Test a full sync is one formatting batch update plus one values update."""
+        sheet = GSheet(spreadsheet_id="abc123")
+        sheet._client = MagicMock()
+        sheet._spreadsheet = MagicMock()
+        sheet._worksheet = MagicMock(id=7)
+        sheet.set_title("TITLE")
+        sheet.set_header(['Product', 'Cost'])
+        sheet.add_data_row({'product': 'Widget', 'cost': 8.3})
+        sheet._sections['data']['columns'][1]['type'] = 'currency'
+
+        sheet.sync()
+
+        sheet._spreadsheet.batch_update.assert_called_once()
+        requests = sheet._spreadsheet.batch_update.call_args[0][0]['requests']
+        assert [next(iter(r)) for r in requests] == [
+            'updateCells', 'repeatCell', 'mergeCells', 'repeatCell', 'updateSheetProperties',
+            'repeatCell'
+        ]
+        assert requests[5]['repeatCell']['range'] == {
+            'sheetId': 7, 'startRowIndex': 2, 'endRowIndex': 3,
+            'startColumnIndex': 1, 'endColumnIndex': 2
+        }
+        sheet._worksheet.format.assert_not_called()
+
+        sheet._spreadsheet.values_batch_update.assert_called_once_with({
+            'valueInputOption': 'USER_ENTERED',
+            'data': [{
+                'range': "'Sheet1'!A1:B3",
+                'values': [['TITLE'], ['Product', 'Cost'], ['Widget', 8.3]]
+            }]
+        })
+
+    def test_sync_only_changed_rows(self):
+        """Test sync after update_data_row writes just the changed rows in one update."""
+        sheet = GSheet(spreadsheet_id="abc123")
+        sheet._client = MagicMock()
+        sheet._spreadsheet = MagicMock()
+        sheet._worksheet = MagicMock()
+        sheet.set_header(['Priority', 'Qty'])
+        sheet.add_data_rows([
+            {'priority': 'P0', 'qty': 1},
+            {'priority': 'P1', 'qty': 2},
+            {'priority': 'P0', 'qty': 3},
+            {'priority': 'P0', 'qty': 4},
+        ])
+        sheet.sync()
+        sheet._spreadsheet.reset_mock()
+
+        sheet.update_data_row(match={'priority': 'P0'}, updates={'qty': 9})
+        stats = sheet.sync()
+
+        assert stats['rows_updated'] == 3
+        sheet._spreadsheet.batch_update.assert_not_called()
+        sheet._spreadsheet.values_batch_update.assert_called_once_with({
+            'valueInputOption': 'USER_ENTERED',
+            'data': [
+                {'range': "'Sheet1'!A2:B2", 'values': [['P0', 9]]},
+                {'range': "'Sheet1'!A4:B5", 'values': [['P0', 9], ['P0', 9]]},
+            ]
+        })
+
+        sheet._spreadsheet.reset_mock()
+        sheet.sync(full=True)
+        sheet._spreadsheet.batch_update.assert_called_once()
+        assert sheet._spreadsheet.values_batch_update.call_args[0][0]['data'][0]['range'] == (
+            "'Sheet1'!A1:B5"
+        )
+
+        # State loaded against a sheet that was renamed away is written in full
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json_path = f.name
+        try:
+            sheet.save(json_path)
+            loaded = GSheet.load(json_path)
+        finally:
+            os.unlink(json_path)
+        client = MagicMock()
+        spreadsheet = client.open_by_key.return_value
+        spreadsheet.worksheet.side_effect = gspread.exceptions.WorksheetNotFound('Sheet1')
+        with patch.object(GSheetAuth, 'get_default_client', return_value=client):
+            stats = loaded.sync()
+
+        assert stats['rows_updated'] == 5
+        spreadsheet.add_worksheet.assert_called_once()
+        assert spreadsheet.values_batch_update.call_args[0][0]['data'][0]['range'] == (
+            "'Sheet1'!A1:B5"
+        )
+
+    def test_sync_picks_up_in_place_edits(self):
+        """Test sync writes rows changed through a find_data_rows() result."""
+        sheet = GSheet(spreadsheet_id="abc123")
+        sheet._client = MagicMock()
+        sheet._spreadsheet = MagicMock()
+        sheet._worksheet = MagicMock()
+        sheet.set_header(['Priority', 'Qty'])
+        sheet.add_data_rows([{'priority': 'P0', 'qty': 1}, {'priority': 'P1', 'qty': 2}])
+        sheet.sync()
+        sheet._spreadsheet.reset_mock()
+
+        sheet.find_data_rows({'priority': 'P1'})[0]['qty'] = 7
+        stats = sheet.sync()
+
+        assert stats['rows_updated'] == 1
+        sheet._spreadsheet.values_batch_update.assert_called_once_with({
+            'valueInputOption': 'USER_ENTERED',
+            'data': [{'range': "'Sheet1'!A3:B3", 'values': [['P1', 7]]}]
+        })
+
+    def test_sync_writes_changed_hashes_only(self):
+        """Test a re-rendering sync writes only rows whose hash changed."""
+        sheet = GSheet(spreadsheet_id="abc123")
+        sheet._client = MagicMock()
+        sheet._spreadsheet = MagicMock()
+        sheet._worksheet = MagicMock(id=7)
+        sheet.set_title("TITLE")
+        sheet.set_header(['A', 'B'])
+        sheet.add_data_rows([{'a': 1, 'b': 2}, {'a': 3, 'b': 4}, {'a': 5, 'b': 6}])
+        sheet.sync()
+        assert len(sheet._meta['row_hashes']) == 5
+        sheet._spreadsheet.reset_mock()
+
+        sheet.set_title("NEW TITLE")
+        sheet._sections['data']['rows'].pop()
+        sheet._mark_structure_changed()
+        stats = sheet.sync()
+
+        assert stats['rows_updated'] == 1
+        requests = sheet._spreadsheet.batch_update.call_args[0][0]['requests']
+        assert requests[0] == {
+            'updateCells': {
+                'range': {'sheetId': 7, 'startRowIndex': 4, 'endRowIndex': 5},
+                'fields': 'userEnteredValue'
+            }
+        }
+        sheet._spreadsheet.values_batch_update.assert_called_once_with({
+            'valueInputOption': 'USER_ENTERED',
+            'data': [{'range': "'Sheet1'!A1:B1", 'values': [['NEW TITLE', '']]}]
+        })
+        assert len(sheet._meta['row_hashes']) == 4
+
 
 class TestGSheetFormatting:
     """Test value formatting."""
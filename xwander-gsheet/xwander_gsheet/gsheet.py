@@ -13,14 +13,64 @@ Example:
     sheet.sync()
 """
 
+import hashlib
 import json
 import os
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import gspread
 from google.oauth2 import service_account
+from gspread.utils import absolute_range_name
+
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install xwander-gsheet[fast]
+    orjson = None
+
+# Numeric conversion per format type; percentages are stored as decimals for
+# the Google Sheets percentage format. Other types are written as-is.
+_FORMATTERS: Dict[Optional[str], Callable[[Any], float]] = {
+    'currency': float,
+    'percentage': lambda value: float(value) / 100,
+    'number': float,
+}
+
+# Write buffer for save(), so the encoder's many small chunks reach disk in few syscalls
+_SAVE_BUFFER_SIZE = 1 << 20
+
+
+def _compute_col_letter(col_num: int) -> str:
+    """Convert column number to letter (1=A, 2=B, ..., 27=AA)."""
+    result = ""
+    while col_num > 0:
+        col_num, remainder = divmod(col_num - 1, 26)
+        result = chr(remainder + ord('A')) + result
+    return result
+
+
+# Column letters A..ZZ (index 0 unused), so common lookups skip the loop
+_COL_LETTERS = [''] + [_compute_col_letter(i) for i in range(1, 703)]
+
+
+def _compile_match(criteria: Dict) -> Callable[[Dict], bool]:
+    """Build a row predicate equivalent to GSheet._matches_criteria(row, criteria)."""
+    if len(criteria) == 1:
+        ((key, value),) = criteria.items()
+        return lambda row: row.get(key) == value
+    items = tuple(criteria.items())
+
+    # A plain loop: all() over a generator costs a generator per row
+    def matches(row: Dict) -> bool:
+        get = row.get
+        for key, value in items:
+            if get(key) != value:
+                return False
+        return True
+
+    return matches
 
 
 class GSheetAuth:
@@ -70,6 +120,12 @@ class GSheet:
 
     DEFAULT_SHARED_DRIVE_ID = "0AOx6w8RvMATMUk9PVA"
 
+    __slots__ = (
+        '_spreadsheet_id', '_worksheet_name', '_client', '_spreadsheet', '_worksheet',
+        '_meta', '_sections', '_section_order', '_section_boundaries',
+        '_layout_cache', '_layout_dirty', '_format_dirty',
+    )
+
     def __init__(self, spreadsheet_id: Optional[str] = None, worksheet_name: str = "Sheet1"):
         """
         Initialize GSheet instance.
@@ -90,12 +146,21 @@ class GSheet:
             "spreadsheet_id": spreadsheet_id,
             "worksheet_name": worksheet_name,
             "created_at": datetime.now(timezone.utc).isoformat(),
-            "last_synced": None
+            "last_synced": None,
+            "row_hashes": [],
+            "synced_cols": 0
         }
         self._sections = {}
         self._section_order = []
         self._section_boundaries = {}
 
+        # Section row ranges, recomputed only after a section gains/loses rows
+        self._layout_cache: Optional[Dict[str, Dict[str, int]]] = None
+        self._layout_dirty = True
+
+        # Section layout changed since the last sync, so formatting is resent
+        self._format_dirty = True
+
     @classmethod
     def load(cls, json_path: str) -> 'GSheet':
         """
@@ -107,8 +172,16 @@ class GSheet:
         Returns:
             GSheet instance
         """
-        with open(json_path, 'r', encoding='utf-8') as f:
-            state = json.load(f)
+        with open(json_path, 'rb') as f:
+            data = f.read()
+        state = None
+        if orjson is not None:
+            try:
+                state = orjson.loads(data)
+            except ValueError:  # e.g. integers beyond 64 bits; the stdlib decoder handles them
+                pass
+        if state is None:
+            state = json.loads(data)
 
         sheet = cls(
             spreadsheet_id=state['_meta']['spreadsheet_id'],
@@ -174,6 +247,7 @@ class GSheet:
             if 'title' not in self._section_order:
                 self._section_order.insert(0, 'title')
 
+        self._mark_structure_changed()
         self._sections['title']['rows'] = [{
             'cells': [{
                 'value': text,
@@ -202,6 +276,7 @@ class GSheet:
                 idx = self._section_order.index('title') + 1 if 'title' in self._section_order else 0
                 self._section_order.insert(idx, 'summary')
 
+        self._mark_structure_changed()
         self._sections['summary']['rows'].append({
             'key': key,
             'value': value,
@@ -237,6 +312,7 @@ class GSheet:
             elif 'header' not in self._section_order:
                 self._section_order.append('header')
 
+        self._mark_structure_changed()
         self._sections['header']['rows'] = [{
             'cells': columns,
             'format': default_format,
@@ -258,6 +334,25 @@ class GSheet:
                 'cost': 8.30
             })
         """
+        self.add_data_rows([data])
+
+    def add_data_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """
+        Add several rows to data table at once.
+
+        Args:
+            rows: Dicts mapping column names to values
+
+        Example:
+            sheet.add_data_rows([
+                {'priority': 'P0', 'product': 'Widget', 'qty': 15},
+                {'priority': 'P1', 'product': 'Gadget', 'qty': 5},
+            ])
+        """
+        new_rows = list(rows)
+        if not new_rows:
+            return
+
         if 'data' not in self._sections:
             self._sections['data'] = {
                 'type': 'table',
@@ -271,10 +366,11 @@ class GSheet:
         if not self._sections['data']['columns']:
             self._sections['data']['columns'] = [
                 {'name': key, 'type': self._infer_type(value)}
-                for key, value in data.items()
+                for key, value in new_rows[0].items()
             ]
 
-        self._sections['data']['rows'].append(data)
+        self._mark_structure_changed()
+        self._sections['data']['rows'].extend(new_rows)
 
     def update_data_row(self, match: Optional[Dict] = None, updates: Optional[Dict] = None) -> int:
         """
@@ -296,13 +392,16 @@ class GSheet:
         if 'data' not in self._sections or not updates:
             return 0
 
-        count = 0
-        for row in self._sections['data']['rows']:
-            if self._matches_criteria(row, match):
-                row.update(updates)
-                count += 1
+        positions = self._find_positions(match)
+        if not positions:
+            return 0
+
+        rows = self._sections['data']['rows']
+        template = dict(updates)
+        for i in positions:
+            rows[i].update(template)
 
-        return count
+        return len(positions)
 
     def find_data_rows(self, criteria: Dict) -> List[Dict]:
         """
@@ -320,10 +419,7 @@ class GSheet:
         if 'data' not in self._sections:
             return []
 
-        return [
-            row for row in self._sections['data']['rows']
-            if self._matches_criteria(row, criteria)
-        ]
+        return self._find_rows(criteria)
 
     def add_footer_line(self, text: str, format: Optional[Dict] = None) -> None:
         """
@@ -342,17 +438,25 @@ class GSheet:
             if 'footer' not in self._section_order:
                 self._section_order.append('footer')
 
+        self._mark_structure_changed()
         self._sections['footer']['rows'].append({
             'text': text,
             'format': format
         })
 
-    def sync(self, sections: str = 'auto') -> Dict:
+    def sync(self, sections: str = 'auto', full: bool = False) -> Dict:
         """
         Sync local state to Google Sheets.
 
+        Every sync re-renders the sheet, but after the first one in a session
+        only rows whose hash differs from the last sync (stored in
+        _meta['row_hashes']) are written, so rows changed in place are picked
+        up too. Formatting
+        is resent only when the section layout changed.
+
         Args:
             sections: 'all' (full rebuild), 'auto' (all sections), or list of names
+            full: Force a full rebuild that rewrites every row
 
         Returns:
             Dict with sync stats
@@ -375,43 +479,83 @@ class GSheet:
                     rows=500,
                     cols=20
                 )
+            # Saved hashes describe the sheet as this state last wrote it; since
+            # then it may have been cleared, renamed or recreated, so the first
+            # sync after connecting rewrites every row
+            self._meta.pop('row_hashes', None)
 
         # Build all rows
+        layout = self._layout()
         all_rows = []
-        self._section_boundaries = {}
-        current_row = 1
-
-        for section_name in self._section_order:
-            section = self._sections.get(section_name)
-            if not section:
-                continue
-
-            start_row = current_row
-            section_rows = self._build_section_rows(section)
-            all_rows.extend(section_rows)
-            end_row = current_row + len(section_rows) - 1
-
-            self._section_boundaries[section_name] = {
-                'start_row': start_row,
-                'end_row': end_row
-            }
-
-            current_row = end_row + 1
-
-        # Clear and update
-        self._worksheet.clear()
-        if all_rows:
-            self._worksheet.update(values=all_rows, range_name='A1', value_input_option='USER_ENTERED')
-
-        # Apply formatting
-        self._apply_formatting()
+        for section_name in layout:
+            all_rows.extend(self._build_section_rows(self._sections[section_name]))
+
+        self._section_boundaries = {name: dict(bounds) for name, bounds in layout.items()}
+
+        hashes = [self._row_hash(row) for row in all_rows]
+        old_hashes = self._meta.get('row_hashes') or []
+        width = max((len(row) for row in all_rows), default=0)
+
+        # One batch update clears stale values and applies formatting, then one
+        # values update writes the rows. Once the sheet holds a synced copy,
+        # only rows whose hash changed are written.
+        sheet_id = self._worksheet.id
+        full_write = full or sections == 'all' or not old_hashes
+        if full_write:
+            requests = [{
+                'updateCells': {
+                    'range': {'sheetId': sheet_id},
+                    'fields': 'userEnteredValue'
+                }
+            }]
+            data = []
+            if all_rows:
+                # Rows may be shorter than the range; the API leaves the rest empty
+                data.append({
+                    'range': absolute_range_name(
+                        self._worksheet_name,
+                        f'A1:{self._col_letter(max(width, 1))}{len(all_rows)}'
+                    ),
+                    'values': all_rows
+                })
+            rows_updated = len(all_rows)
+        else:
+            requests = []
+            if len(old_hashes) > len(all_rows):
+                requests.append({
+                    'updateCells': {
+                        'range': {
+                            'sheetId': sheet_id,
+                            'startRowIndex': len(all_rows),
+                            'endRowIndex': len(old_hashes)
+                        },
+                        'fields': 'userEnteredValue'
+                    }
+                })
+            # Pad changed rows to the widest synced row so shorter rows
+            # overwrite any leftover cells
+            width = max(width, self._meta.get('synced_cols') or 0)
+            data, rows_updated = self._changed_row_ranges(all_rows, hashes, old_hashes, width)
+        if full_write or self._format_dirty:
+            requests.extend(self._formatting_requests(sheet_id))
+        if requests:
+            self._spreadsheet.batch_update({'requests': requests})
+
+        if data:
+            self._spreadsheet.values_batch_update({
+                'valueInputOption': 'USER_ENTERED',
+                'data': data
+            })
+        self._meta['row_hashes'] = hashes
+        self._meta['synced_cols'] = width
 
         # Update metadata
         self._meta['last_synced'] = datetime.now(timezone.utc).isoformat()
+        self._format_dirty = False
 
         return {
             'sections_synced': list(self._section_boundaries.keys()),
-            'rows_updated': len(all_rows),
+            'rows_updated': rows_updated,
             'timestamp': self._meta['last_synced']
         }
 
@@ -432,8 +576,20 @@ class GSheet:
         # Ensure directory exists
         Path(json_path).parent.mkdir(parents=True, exist_ok=True)
 
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(state, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            try:
+                payload = orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            except TypeError:  # e.g. integers beyond 64 bits; the stdlib encoder handles them
+                payload = None
+            if payload is not None:
+                with open(json_path, 'wb') as f:
+                    f.write(payload)
+                return
+
+        # Stream the encoder's chunks straight into the file buffer
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+        with open(json_path, 'w', encoding='utf-8', buffering=_SAVE_BUFFER_SIZE) as f:
+            f.writelines(encoder.iterencode(state))
 
     def get_url(self) -> str:
         """Get Google Sheets URL."""
@@ -459,6 +615,69 @@ class GSheet:
 
     # --- Private Methods ---
 
+    def _mark_structure_changed(self) -> None:
+        """Record that sections gained or replaced rows: new layout and formatting."""
+        self._layout_dirty = True
+        self._format_dirty = True
+
+    @staticmethod
+    def _row_hash(row: List[Any]) -> str:
+        """Short digest of a rendered row, compared across syncs to find changes."""
+        raw = json.dumps(row, default=str, separators=(',', ':'))
+        return hashlib.blake2b(raw.encode('utf-8'), digest_size=8).hexdigest()
+
+    def _changed_row_ranges(self, all_rows: List[List[Any]], hashes: List[str],
+                            old_hashes: List[str], width: int) -> Tuple[List[Dict], int]:
+        """Values-update entries covering each run of rows whose hash changed."""
+        last_col = self._col_letter(max(width, 1))
+        data = []
+        rows_updated = 0
+        run_start = None
+        for index in range(len(all_rows) + 1):
+            changed = (index < len(all_rows)
+                       and (index >= len(old_hashes) or hashes[index] != old_hashes[index]))
+            if changed:
+                if run_start is None:
+                    run_start = index
+                continue
+            if run_start is not None:
+                data.append({
+                    'range': absolute_range_name(
+                        self._worksheet_name, f'A{run_start + 1}:{last_col}{index}'
+                    ),
+                    'values': [row + [''] * (width - len(row)) for row in all_rows[run_start:index]]
+                })
+                rows_updated += index - run_start
+                run_start = None
+        return data, rows_updated
+
+    def _layout(self) -> Dict[str, Dict[str, int]]:
+        """Start/end row of each section, cached until a mutator changes row counts."""
+        if self._layout_dirty or self._layout_cache is None:
+            layout = {}
+            current_row = 1
+            for section_name in self._section_order:
+                section = self._sections.get(section_name)
+                if not section:
+                    continue
+
+                end_row = current_row + self._section_row_count(section) - 1
+                layout[section_name] = {
+                    'start_row': current_row,
+                    'end_row': end_row
+                }
+                current_row = end_row + 1
+
+            self._layout_cache = layout
+            self._layout_dirty = False
+        return self._layout_cache
+
+    def _section_row_count(self, section: Dict) -> int:
+        """Number of sheet rows _build_section_rows produces for a section."""
+        if section.get('type') in ('title', 'key_value', 'header', 'table', 'text_block'):
+            return len(section.get('rows', []))
+        return 0
+
     def _build_section_rows(self, section: Dict) -> List[List[Any]]:
         """Build rows array for a section."""
         section_type = section.get('type')
@@ -477,54 +696,78 @@ class GSheet:
             return [[cell for cell in row['cells']] for row in section.get('rows', [])]
 
         elif section_type == 'table':
-            rows = []
-            columns = section.get('columns', [])
-            for row_data in section.get('rows', []):
-                row = []
-                for col in columns:
-                    col_name = col['name']
-                    value = row_data.get(col_name, '')
-                    formatted = self._format_value(value, col.get('type'))
-                    row.append(formatted)
-                rows.append(row)
-            return rows
+            return self._build_table_rows(section.get('columns', []), section.get('rows', []))
 
         elif section_type == 'text_block':
             return [[row.get('text', '')] for row in section.get('rows', [])]
 
         return []
 
-    def _format_value(self, value: Any, format_type: Optional[str]) -> Any:
+    def _build_table_rows(self, columns: List[Dict], data_rows: List[Dict]) -> List[List[Any]]:
+        """Build sheet rows for data table rows."""
+        if not columns:
+            return [[] for _ in data_rows]
+
+        # One C-level itemgetter call pulls every cell of a row (missing keys
+        # filled from the defaults), then each column is formatted in one pass
+        names = [col['name'] for col in columns]
+        defaults = dict.fromkeys(names, '')
+        getter = itemgetter(*names)
+        if len(names) == 1:
+            cells = [(getter({**defaults, **row_data}),) for row_data in data_rows]
+        else:
+            cells = [getter({**defaults, **row_data}) for row_data in data_rows]
+
+        formatted_columns = []
+        for col, values in zip(columns, zip(*cells)):
+            col_type = col.get('type')
+            convert = _FORMATTERS.get(col_type)
+            if convert is not None:
+                try:
+                    values = ['' if value is None or value == '' else convert(value)
+                              for value in values]
+                except (ValueError, TypeError):
+                    # Some value is not numeric; keep those as-is
+                    values = [self._format_value(value, col_type) for value in values]
+            elif None in values:
+                values = ['' if value is None else value for value in values]
+            formatted_columns.append(values)
+        return [list(row) for row in zip(*formatted_columns)]
+
+    @staticmethod
+    def _format_value(value: Any, format_type: Optional[str]) -> Any:
         """Format value based on type."""
         if value is None or value == '':
             return ''
 
-        if format_type == 'currency':
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return value
+        convert = _FORMATTERS.get(format_type)
+        if convert is None:
+            return value
+        try:
+            return convert(value)
+        except (ValueError, TypeError):
+            return value
 
-        elif format_type == 'percentage':
-            try:
-                # Store as decimal for Google Sheets percentage format
-                return float(value) / 100
-            except (ValueError, TypeError):
-                return value
+    @staticmethod
+    def _infer_type(value: Any) -> str:
+        """Infer column type from value."""
+        return 'number' if isinstance(value, (int, float)) else 'text'
 
-        elif format_type == 'number':
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return value
+    def _find_rows(self, criteria: Optional[Dict]) -> List[Dict]:
+        """Data rows matching criteria, in row order."""
+        rows = self._sections['data']['rows']
+        if not criteria:
+            return list(rows)
+        return [rows[i] for i in self._find_positions(criteria)]
 
-        return value
+    def _find_positions(self, criteria: Optional[Dict]) -> List[int]:
+        """Positions of data rows matching criteria, in row order."""
+        rows = self._sections['data']['rows']
+        if not criteria:
+            return list(range(len(rows)))
 
-    def _infer_type(self, value: Any) -> str:
-        """Infer column type from value."""
-        if isinstance(value, (int, float)):
-            return 'number'
-        return 'text'
+        matches = _compile_match(criteria)
+        return [i for i, row in enumerate(rows) if matches(row)]
 
     def _matches_criteria(self, row: Dict, criteria: Optional[Dict]) -> bool:
         """Check if row matches criteria dict."""
@@ -532,8 +775,20 @@ class GSheet:
             return True
         return all(row.get(k) == v for k, v in criteria.items())
 
-    def _apply_formatting(self) -> None:
-        """Apply formatting to sections."""
+    def _formatting_requests(self, sheet_id: int) -> List[Dict]:
+        """Sheets API batchUpdate requests that format every synced section."""
+        requests = []
+
+        def repeat_cell(start_row: int, end_row: int, start_col: int, end_col: int,
+                        cell_format: Dict) -> None:
+            requests.append({
+                'repeatCell': {
+                    'range': self._grid_range(sheet_id, start_row, end_row, start_col, end_col),
+                    'cell': {'userEnteredFormat': cell_format},
+                    'fields': f"userEnteredFormat({','.join(cell_format.keys())})"
+                }
+            })
+
         for section_name, bounds in self._section_boundaries.items():
             section = self._sections.get(section_name)
             if not section:
@@ -548,58 +803,73 @@ class GSheet:
                 row_data = section['rows'][0]
                 cell_format = row_data['cells'][0].get('format', {})
                 if cell_format:
-                    range_name = f'A{start_row}'
-                    self._worksheet.format(range_name, cell_format)
+                    repeat_cell(start_row, start_row, 1, 1, cell_format)
                     # Merge cells if colspan specified
                     colspan = row_data['cells'][0].get('colspan', 1)
                     if colspan > 1:
-                        self._worksheet.merge_cells(
-                            start_row, 1, start_row, colspan
-                        )
+                        requests.append({
+                            'mergeCells': {
+                                'mergeType': 'MERGE_ALL',
+                                'range': self._grid_range(sheet_id, start_row, start_row, 1, colspan)
+                            }
+                        })
 
             # Header formatting
             elif section_type == 'header' and section.get('rows'):
                 row_data = section['rows'][0]
                 cell_format = row_data.get('format', {})
                 if cell_format:
-                    # Get number of columns
-                    num_cols = len(row_data['cells'])
-                    range_name = f'A{start_row}:{self._col_letter(num_cols)}{start_row}'
-                    self._worksheet.format(range_name, cell_format)
+                    repeat_cell(start_row, start_row, 1, len(row_data['cells']), cell_format)
 
                 # Freeze header row
                 if row_data.get('freeze', False):
-                    self._worksheet.freeze(rows=start_row)
+                    requests.append({
+                        'updateSheetProperties': {
+                            'properties': {
+                                'sheetId': sheet_id,
+                                'gridProperties': {'frozenRowCount': start_row}
+                            },
+                            'fields': 'gridProperties.frozenRowCount'
+                        }
+                    })
 
             # Data table formatting
             elif section_type == 'table':
                 columns = section.get('columns', [])
-                for col_idx, col in enumerate(columns):
+                for col_idx, col in enumerate(columns, start=1):
                     col_type = col.get('type')
-                    if col_type in ('currency', 'percentage', 'number'):
-                        col_letter = self._col_letter(col_idx + 1)
-                        range_name = f'{col_letter}{start_row}:{col_letter}{end_row}'
-
-                        if col_type == 'currency':
-                            self._worksheet.format(range_name, {
-                                'numberFormat': {
-                                    'type': 'CURRENCY',
-                                    'pattern': '€#,##0.00'
-                                }
-                            })
-                        elif col_type == 'percentage':
-                            self._worksheet.format(range_name, {
-                                'numberFormat': {
-                                    'type': 'PERCENT',
-                                    'pattern': '0.0%'
-                                }
-                            })
-
-    def _col_letter(self, col_num: int) -> str:
+                    if col_type == 'currency':
+                        repeat_cell(start_row, end_row, col_idx, col_idx, {
+                            'numberFormat': {
+                                'type': 'CURRENCY',
+                                'pattern': '€#,##0.00'
+                            }
+                        })
+                    elif col_type == 'percentage':
+                        repeat_cell(start_row, end_row, col_idx, col_idx, {
+                            'numberFormat': {
+                                'type': 'PERCENT',
+                                'pattern': '0.0%'
+                            }
+                        })
+
+        return requests
+
+    @staticmethod
+    def _grid_range(sheet_id: int, start_row: int, end_row: int,
+                    start_col: int, end_col: int) -> Dict[str, int]:
+        """GridRange for 1-based inclusive row/column bounds."""
+        return {
+            'sheetId': sheet_id,
+            'startRowIndex': start_row - 1,
+            'endRowIndex': end_row,
+            'startColumnIndex': start_col - 1,
+            'endColumnIndex': end_col
+        }
+
+    @staticmethod
+    def _col_letter(col_num: int) -> str:
         """Convert column number to letter (1=A, 2=B, ..., 27=AA)."""
-        result = ""
-        while col_num > 0:
-            col_num -= 1
-            result = chr(col_num % 26 + ord('A')) + result
-            col_num //= 26
-        return result
+        if 0 < col_num < len(_COL_LETTERS):
+            return _COL_LETTERS[col_num]
+        return _compute_col_letter(col_num)